@@ -3,11 +3,23 @@ Configuration management for the scraping framework.
 Handles loading and validation of YAML configuration files.
 """
 
+import copy
 import os
+import threading
 import yaml
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
 from .exceptions import ConfigurationError
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one if unavailable
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed YAML keyed by absolute path, validated against (mtime, size).
+# Callers get deep copies, so the cached dicts are never mutated.
+_YAML_CACHE: 'OrderedDict[str, Tuple[float, int, Dict[str, Any]]]' = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
 
 class ConfigManager:
     """Manages loading and validation of configuration files."""
@@ -29,17 +41,36 @@ class ConfigManager:
         self._validate_sources()
     
     def _load_yaml_file(self, file_path: str) -> Dict[str, Any]:
-        """Load and parse a YAML file."""
-        if not os.path.exists(file_path):
+        """Load and parse a YAML file, reusing the parse while the file is unchanged."""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             raise ConfigurationError(f"Configuration file not found: {file_path}")
+        except OSError as e:
+            raise ConfigurationError(f"Error reading {file_path}: {e}")
+        
+        cache_key = os.path.abspath(file_path)
+        with _YAML_CACHE_LOCK:
+            cached = _YAML_CACHE.get(cache_key)
+            if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                _YAML_CACHE.move_to_end(cache_key)
+                return copy.deepcopy(cached[2])
         
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file) or {}
+                data = yaml.load(file, Loader=_YAML_LOADER) or {}
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in {file_path}: {e}")
         except Exception as e:
             raise ConfigurationError(f"Error reading {file_path}: {e}")
+        
+        with _YAML_CACHE_LOCK:
+            _YAML_CACHE[cache_key] = (stat.st_mtime, stat.st_size, copy.deepcopy(data))
+            _YAML_CACHE.move_to_end(cache_key)
+            while len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+                _YAML_CACHE.popitem(last=False)
+        
+        return data
     
     def _validate_config(self):
         """Validate the main configuration schema."""
@@ -5,14 +5,16 @@ Handles modern news sites, social media content, and dynamic government portals.
 
 import asyncio
 import logging
+import queue
+import threading
 import time
 import os
 from typing import Dict, Optional, List, Any
 from urllib.parse import urlparse
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from .exceptions import NetworkError, RobotsBlockedError
-from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -24,6 +26,22 @@ class DynamicScraper:
     Specifically optimized for modern Mexican news and government websites.
     """
     
+    # Webhook session shared by every instance so notifications reuse the
+    # keep-alive connection to discord.com
+    _webhook_session: Optional[requests.Session] = None
+    _webhook_session_lock = threading.Lock()
+    
+    @classmethod
+    def _get_webhook_session(cls) -> requests.Session:
+        """Return the shared webhook session, creating it on first use."""
+        if cls._webhook_session is None:
+            with cls._webhook_session_lock:
+                if cls._webhook_session is None:
+                    session = requests.Session()
+                    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+                    cls._webhook_session = session
+        return cls._webhook_session
+    
     def __init__(self, politeness_config: Dict):
         self.politeness_config = politeness_config
         self.logger = logging.getLogger(__name__)
@@ -31,8 +49,11 @@ class DynamicScraper:
         self.context: Optional[BrowserContext] = None
         self.playwright = None
         
-        # Discord webhook for notifications
+        # Discord webhook for notifications, posted from a background thread so
+        # webhook latency never stalls page fetching
         self.discord_webhook = os.getenv("DISCORD_CHANNEL_WEBHOOK")
+        self._notify_queue: queue.Queue = queue.Queue(maxsize=1024)
+        self._notify_thread: Optional[threading.Thread] = None
         
         # Sites that require JavaScript rendering
         self.js_required_domains = {
@@ -47,6 +68,8 @@ class DynamicScraper:
             'forbes.com.mx',
             'expansion.mx'
         }
+        # Dot-prefixed suffixes so 'www.milenio.com' matches but 'notmilenio.com' does not
+        self._js_domain_suffixes = tuple('.' + d for d in self.js_required_domains)
         
         # Anti-bot detection patterns to handle
         self.antibot_patterns = [
@@ -69,37 +92,80 @@ class DynamicScraper:
                 description = (f"**URL:** {url}\n\n"
                               f"🔒 **Status:** Anti-bot protection encountered\n"
                               f"🔄 **Action:** Attempting bypass procedures\n"
-                              f"⏱️ **Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                              f"⏱️ **Time:** {time.strftime('%Y-%m-%d %H:%M:%S')}")
                 color = 16776960  # Yellow/orange color
             elif message_type == "success":
                 title = "✅ Dynamic Content Successfully Scraped"
                 description = (f"**URL:** {url}\n\n"
                               f"🎆 **Status:** Content successfully extracted\n"
                               f"⚙️ **Method:** Dynamic JavaScript rendering\n"
-                              f"⏱️ **Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                              f"⏱️ **Time:** {time.strftime('%Y-%m-%d %H:%M:%S')}")
                 color = 65280  # Green color
             else:
                 return
             
-            payload = {
-                "embeds": [{
-                    "title": title,
-                    "description": description,
-                    "color": color,
-                    "footer": {"text": "Spanish Corpus Framework | Dynamic Scraper"},
-                    "timestamp": datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.000Z')
-                }]
+            embed = {
+                "title": title,
+                "description": description,
+                "color": color,
+                "footer": {"text": "Spanish Corpus Framework | Dynamic Scraper"},
+                "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
             }
             
-            response = requests.post(
-                self.discord_webhook,
-                json=payload,
-                timeout=10
-            )
-            response.raise_for_status()
+            if self._notify_thread is None:
+                self._notify_thread = threading.Thread(
+                    target=self._notify_worker, name="discord-notifier", daemon=True
+                )
+                self._notify_thread.start()
+            
+            self._notify_queue.put_nowait(embed)
             
+        except queue.Full:
+            self.logger.debug(f"Discord notification queue full, dropping notification for {url}")
         except Exception as e:
-            self.logger.warning(f"Failed to send Discord notification: {e}")
+            self.logger.warning(f"Failed to queue Discord notification: {e}")
+    
+    def _notify_worker(self):
+        """Drain queued embeds and post them, batching up to Discord's 10 embeds per message."""
+        session = self._get_webhook_session()
+        running = True
+        
+        while running:
+            embed = self._notify_queue.get()
+            if embed is None:
+                break
+            
+            embeds = [embed]
+            while len(embeds) < 10:
+                try:
+                    embed = self._notify_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if embed is None:
+                    running = False
+                    break
+                embeds.append(embed)
+            
+            try:
+                response = session.post(
+                    self.discord_webhook,
+                    json={"embeds": embeds},
+                    timeout=10
+                )
+                response.raise_for_status()
+            except Exception as e:
+                self.logger.warning(f"Failed to send Discord notification: {e}")
+    
+    def _stop_notifier(self, timeout: float = 30.0):
+        """Queue the shutdown sentinel and wait for pending notifications to be posted."""
+        try:
+            self._notify_queue.put(None, timeout=timeout)
+        except queue.Full:
+            self.logger.warning("Discord notification queue still full, notifier not stopped")
+            return
+        self._notify_thread.join(timeout=timeout)
+        if self._notify_thread.is_alive():
+            self.logger.warning("Discord notifier did not finish flushing before shutdown")
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -180,7 +246,7 @@ class DynamicScraper:
     def requires_js_rendering(self, url: str) -> bool:
         """Check if URL requires JavaScript rendering."""
         domain = urlparse(url).netloc.lower()
-        return any(js_domain in domain for js_domain in self.js_required_domains)
+        return ('.' + domain).endswith(self._js_domain_suffixes)
     
     async def detect_antibot_protection(self, page: Page) -> bool:
         """Detect if page has anti-bot protection."""
@@ -445,6 +511,11 @@ class DynamicScraper:
                 await self.playwright.stop()
                 self.playwright = None
             
+            # Let the notifier flush what is already queued, then exit
+            if self._notify_thread is not None:
+                await asyncio.to_thread(self._stop_notifier)
+                self._notify_thread = None
+            
             self.logger.info("Dynamic scraper closed successfully")
             
         except Exception as e:
@@ -49,6 +49,9 @@ class EnhancedSaver:
         self.organize_by_domain = storage_config.get('organize_by_domain', True)
         self.max_files_per_dir = storage_config.get('max_files_per_dir', 10000)
         
+        # Directories already created this process, so saves skip the mkdir syscalls
+        self._created_dirs = set()
+        
         # Ensure directories exist
         self._ensure_directories()
         
@@ -90,6 +93,12 @@ class EnhancedSaver:
             except Exception as e:
                 raise ScrapingError(f"Failed to create directory {directory}: {e}")
     
+    def _ensure_dir(self, directory: Path):
+        """Create a directory once per process; later calls are a set lookup."""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+    
     def _get_snapshot_dir(self) -> str:
         """Get snapshot directory path."""
         return self.storage_config.get('snapshot_dir', '../data/snapshots')
@@ -180,7 +189,7 @@ class EnhancedSaver:
             else:
                 source_snapshot_dir = snapshot_dir / source_name
             
-            source_snapshot_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(source_snapshot_dir)
             
             # Generate snapshot filename
             date_str = datetime.now().strftime('%Y%m%d')
@@ -245,15 +254,17 @@ class EnhancedSaver:
         else:
             organized_dir = output_dir / source_name
         
-        organized_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(organized_dir)
         
-        # Check if directory has too many files
-        existing_files = list(organized_dir.glob('*.txt'))
-        if len(existing_files) >= self.max_files_per_dir:
+        # Check if directory has too many files. scandir yields names without
+        # building Path objects or running fnmatch, which matters on every save
+        with os.scandir(organized_dir) as entries:
+            existing_count = sum(1 for entry in entries if entry.name.endswith('.txt'))
+        if existing_count >= self.max_files_per_dir:
             # Create subdirectory
-            subdir_num = len(existing_files) // self.max_files_per_dir + 1
+            subdir_num = existing_count // self.max_files_per_dir + 1
             organized_dir = organized_dir / f"batch_{subdir_num:03d}"
-            organized_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(organized_dir)
         
         return organized_dir
     
@@ -296,7 +307,7 @@ class EnhancedSaver:
             # Check for duplicates
             if content_hash in self.saved_hashes:
                 result['duplicate'] = True
-                self.logger.info(f"Skipping duplicate content (hash: {content_hash})")
+                self.logger.debug("Skipping duplicate content (hash: %s)", content_hash)
                 return result
             
             # Generate file path
@@ -336,9 +347,9 @@ class EnhancedSaver:
                     self.snapshot_config.get('link_to_processed', True)):
                     self._create_content_link(result['file_path'], result['snapshot_path'])
                 
-                self.logger.info(
-                    f"Saved enhanced content: {file_path} "
-                    f"({len(content)} chars, {token_count:,} tokens)"
+                self.logger.debug(
+                    "Saved enhanced content: %s (%d chars, %d tokens)",
+                    file_path, len(content), token_count
                 )
             else:
                 result['error'] = "Failed to write file"
@@ -392,9 +403,9 @@ class EnhancedSaver:
                 self.logger.warning(f"Content validation failed for {source_name}: {e}")
                 return False
             
-            # Write with UTF-8 encoding
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Encode to UTF-8 once and write bytes, bypassing the text-layer encoder
+            with open(temp_path, 'wb') as f:
+                f.write(content.encode('utf-8'))
                 f.flush()
                 os.fsync(f.fileno())
             
@@ -497,7 +508,7 @@ class EnhancedSaver:
             if self.snapshots_enabled:
                 snapshot_dir = Path(self._get_snapshot_dir())
                 if snapshot_dir.exists():
-                    stats['snapshots'] = len(list(snapshot_dir.rglob('*.html*')))
+                    stats['snapshots'] = sum(1 for _ in snapshot_dir.rglob('*.html*'))
             
             # Convert bytes to MB
             stats['total_size_mb'] = round(stats['total_size_bytes'] / (1024 * 1024), 2)
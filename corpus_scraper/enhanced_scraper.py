@@ -7,21 +7,237 @@ import time
 import random
 import logging
 import os
+import json
+import gzip
+import io
+import socket
 import asyncio
+import itertools
 import requests
-from urllib.parse import urlparse, urljoin
-from typing import Dict, Optional, List, Union
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse, urljoin, ParseResult
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional, List
+from tenacity import retry, stop_after_attempt, retry_if_exception
 from protego import Protego
-from fake_useragent import UserAgent
+from charset_normalizer import from_bytes
+from lxml import etree
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 import concurrent.futures
-from threading import Lock
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock, BoundedSemaphore, Thread
 
-from .exceptions import RobotsBlockedError, NetworkError
+from .exceptions import RobotsBlockedError, NetworkError, HTTPStatusError
 from .encoding_validator import EncodingValidator
 
 
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
+# Google only honors the first 500 KiB of robots.txt; anything past it is ignored
+ROBOTS_MAX_BYTES = 500 * 1024
+
+# Largest body _fetch_http will buffer
+DEFAULT_MAX_CONTENT_BYTES = 10 * 1024 * 1024
+
+# Media bodies no extractor here can use; rejected from headers without downloading
+SKIPPED_CONTENT_TYPES = ('image/', 'video/', 'audio/')
+
+# Rules assumed when robots.txt itself is forbidden to us
+ROBOTS_DISALLOW_ALL = "User-agent: *\nDisallow: /\n"
+
+
+def _parse_sitemap(source) -> List[str]:
+    """
+    Extract page URLs from a sitemap file object with streaming lxml parsing.
+    
+    Each <url> element is cleared once read so memory stays flat on large
+    sitemaps. Both namespaced and namespace-less sitemaps are accepted.
+    """
+    urls = []
+    for _, elem in etree.iterparse(source, events=('end',), tag=(f'{SITEMAP_NS}url', 'url')):
+        loc = elem.findtext(f'{SITEMAP_NS}loc') or elem.findtext('loc')
+        if loc:
+            urls.append(loc.strip())
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    
+    return urls
+
+
+@dataclass(frozen=True)
+class DomainPolicy:
+    """Resolved rate-limit settings for one domain, in nanoseconds."""
+    delay_ns: int
+    jitter_ns: int
+    cap_ns: int
+
+
+class TokenBucket:
+    """
+    Thread-safe per-domain token bucket that hands out request reservations.
+    
+    Tokens refill one per interval up to capacity. A caller takes a token under
+    a short lock and is told how long to wait for it, so the sleep itself
+    happens outside the lock and never blocks other callers.
+    """
+    
+    def __init__(self, interval_ns: int, capacity: int = 1):
+        self.interval_ns = interval_ns
+        self.burst_ns = max(capacity - 1, 0) * interval_ns
+        # Time at which the bucket is back to holding no spare tokens
+        self._full_at = time.monotonic_ns()
+        self._lock = Lock()
+    
+    def set_interval(self, interval_ns: int, capacity: int = 1):
+        """Change the refill interval, keeping already handed-out reservations."""
+        with self._lock:
+            self.interval_ns = interval_ns
+            self.burst_ns = max(capacity - 1, 0) * interval_ns
+    
+    def reserve(self, extra_ns: int = 0) -> float:
+        """Take a token, returning the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic_ns()
+            full_at = max(self._full_at, now)
+            start = max(now, full_at - self.burst_ns)
+            self._full_at = full_at + self.interval_ns + extra_ns
+        return (start - now) / 1e9
+
+
+# Fallback rotation used when politeness config provides no user_agents
+DEFAULT_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+)
+
+
+def _buffer_capped(headers, status_code: int, chunks, url: str, max_bytes: int) -> bytes:
+    """
+    Buffer a streamed body, rejecting media types and anything past max_bytes.
+    
+    Shared by the requests and HTTP/2 paths; headers only needs .get().
+    """
+    content_type = headers.get('Content-Type', '').lower()
+    if content_type.startswith(SKIPPED_CONTENT_TYPES):
+        raise HTTPStatusError(f"Unsupported content type {content_type}: {url}",
+                              status_code, retryable=False)
+    
+    content_length = headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise HTTPStatusError(f"Response of {content_length} bytes exceeds {max_bytes}: {url}",
+                              status_code, retryable=False)
+    
+    body = bytearray()
+    for chunk in chunks:
+        body += chunk
+        if len(body) > max_bytes:
+            raise HTTPStatusError(f"Response exceeds {max_bytes} bytes: {url}",
+                                  status_code, retryable=False)
+    return bytes(body)
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Lower-cased network location of a URL, cached since hosts repeat heavily."""
+    return urlparse(url).netloc.lower()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return float(int(value))
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+def _server_retry_delay(response: requests.Response) -> Optional[float]:
+    """
+    Seconds the server asked us to wait, from Retry-After or X-RateLimit-Reset.
+    
+    X-RateLimit-Reset is sent either as an epoch timestamp or as seconds
+    remaining; values that look like epoch times are converted to a delay.
+    """
+    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+    if retry_after is not None:
+        return retry_after
+    
+    reset = response.headers.get('X-RateLimit-Reset')
+    if not reset:
+        return None
+    try:
+        reset = float(reset)
+    except ValueError:
+        return None
+    return reset - time.time() if reset > 1e9 else reset
+
+
+def _handle_429(response: requests.Response, url: str):
+    """Rate limited: retry after the server-requested delay when given."""
+    raise HTTPStatusError(f"HTTP 429 Too Many Requests: {url}", 429, retryable=True,
+                          retry_after=_server_retry_delay(response))
+
+
+def _handle_4xx_noretry(response: requests.Response, url: str):
+    """Client errors won't change on retry."""
+    raise HTTPStatusError(f"HTTP {response.status_code}: {url}", response.status_code, retryable=False)
+
+
+def _handle_5xx(response: requests.Response, url: str):
+    """Server errors are usually transient; 503s often say when to come back."""
+    raise HTTPStatusError(f"HTTP {response.status_code} server error: {url}", response.status_code, retryable=True,
+                          retry_after=_server_retry_delay(response))
+
+
+# Built once at import; unlisted codes fall back by class in _get_status_handler
+_STATUS_HANDLERS = {
+    429: _handle_429,
+    403: _handle_4xx_noretry,
+    404: _handle_4xx_noretry,
+    410: _handle_4xx_noretry,
+}
+
+
+def _get_status_handler(status_code: int):
+    """Return the handler for an error status, or None for success codes."""
+    handler = _STATUS_HANDLERS.get(status_code)
+    if handler is None and status_code >= 400:
+        handler = _handle_5xx if status_code >= 500 else _handle_4xx_noretry
+    return handler
+
+
+def _retry_wait(retry_state) -> float:
+    """
+    Seconds to wait before the next attempt.
+    
+    Honors a server-provided Retry-After or X-RateLimit-Reset (clamped to 10
+    minutes, plus up to 1s of jitter so workers don't retry in lockstep),
+    otherwise backs off exponentially: 1s, 2s, 4s... capped at 10s.
+    """
+    retry_after = getattr(retry_state.outcome.exception(), 'retry_after', None)
+    if retry_after is not None:
+        return min(max(retry_after, 1.0), 600.0) + random.random()
+    return min(1 << min(retry_state.attempt_number - 1, 4), 10)
+
+
+def _is_retryable(exception: BaseException) -> bool:
+    """Retry network failures, except HTTP statuses marked as permanent."""
+    if isinstance(exception, HTTPStatusError):
+        return exception.retryable
+    return isinstance(exception, (requests.RequestException, NetworkError))
+
+
 class BrowserPool:
     """Manages a pool of Playwright browser instances for efficient resource usage."""
     
@@ -97,33 +313,94 @@ class EnhancedScraper:
         # HTTP session setup
         self.session = requests.Session()
         self.robots_parsers = {}
+        # Monotonic deadline after which a domain's robots.txt is reloaded, and a
+        # per-domain generation bumped whenever its rules are replaced
+        self._robots_expiry: Dict[str, float] = {}
+        self._robots_generation: Dict[str, int] = {}
+        # Memoized robots.txt decisions keyed by (domain, path, user_agent, generation)
+        self._robots_allowed = lru_cache(
+            maxsize=self.politeness_config.get('robots_decision_cache_size', 65536)
+        )(self._robots_allowed_uncached)
+        
+        # On-disk robots.txt cache shared across runs, revalidated with conditional GETs
+        self.robots_cache_dir = Path(self.politeness_config.get(
+            'robots_cache_dir', '~/.cache/corpus_scraper/robots'
+        )).expanduser()
+        self.robots_cache_ttl = self.politeness_config.get('robots_cache_ttl', 86400)
+        # Failed robots.txt loads keep the previous rules and are retried this soon
+        self.robots_retry_interval = self.politeness_config.get('robots_retry_interval', 300)
         self.logger = logging.getLogger(__name__)
         
         # User agent management
-        self.user_agents = self.politeness_config.get('user_agents', [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        ])
-        self.current_ua_index = 0
+        self.user_agents = tuple(self.politeness_config.get('user_agents') or DEFAULT_USER_AGENTS)
+        # itertools.cycle advances atomically, so fetch threads never share an index
+        self._ua_cycle = itertools.cycle(self.user_agents)
+        # Robots rules are evaluated for one fixed agent so decisions stay cacheable
+        # and checks don't advance the request rotation
+        self.robots_user_agent = self.politeness_config.get('robots_user_agent', self.user_agents[0])
+        
+        # Response bodies larger than this are abandoned mid-download
+        self.max_content_bytes = self.politeness_config.get('max_content_bytes', DEFAULT_MAX_CONTENT_BYTES)
         
         # Browser automation setup
         self.browser_pool = None
         self.browser_enabled = self.browser_config.get('enabled', True)
         
-        # Rate limiting
-        self.last_request_times = {}
+        # Rate limiting: per-domain token buckets and concurrency caps, so a
+        # throttled domain never blocks workers fetching other domains
+        self.domain_limiters: Dict[str, TokenBucket] = {}
+        self.rate_limit_burst = self.politeness_config.get('rate_limit_burst', 1)
+        self._rate_lock = Lock()
+        self._host_semaphores: Dict[str, BoundedSemaphore] = {}
+        self.max_concurrent_per_domain = self.politeness_config.get('max_concurrent_per_domain', 4)
         self.domain_delays = self.politeness_config.get('domain_rate_limits', {
             'reddit.com': 2.0,
             'youtube.com': 1.0,
             'wikipedia.org': 0.5,
             'default': 0.3
         })
+        # Per-domain policies resolved once from domain_rate_limits, jitter and
+        # any robots.txt Crawl-delay
+        self._domain_policies: Dict[str, DomainPolicy] = {}
+        self.crawl_delays: Dict[str, float] = {}
         
         # Encoding validator
         self.encoding_validator = EncodingValidator()
         
+        self._setup_session()
+        
         self.logger.info(f"Enhanced scraper initialized - Browser automation: {self.browser_enabled}")
     
+    def _setup_session(self):
+        """Mount a pooled adapter so connections are kept alive across requests."""
+        # Retries are handled by tenacity in _fetch_http, not by urllib3.
+        # pool_connections is the number of hosts kept pooled, pool_maxsize the
+        # sockets kept per host; both sized well above the fetch worker count
+        adapter = HTTPAdapter(
+            pool_connections=self.politeness_config.get('pool_connections', 64),
+            pool_maxsize=self.politeness_config.get('pool_maxsize', 128),
+            pool_block=False,
+            max_retries=Retry(total=0)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['Connection'] = 'keep-alive'
+        
+        # Optional HTTP/2 client: multiplexes requests to CDN-fronted news sites
+        # over one TLS connection per host
+        self.http2_client = None
+        if self.politeness_config.get('http2', False):
+            try:
+                import httpx
+                self.http2_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100,
+                                        keepalive_expiry=60),
+                    verify=self.politeness_config.get('ssl_verify', False)
+                )
+            except ImportError:
+                self.logger.warning("httpx[http2] not available, using HTTP/1.1. To install, run: pip install 'httpx[http2]'")
+    
     async def _ensure_browser_pool(self):
         """Ensure browser pool is initialized."""
         if self.browser_enabled and self.browser_pool is None:
@@ -132,12 +409,56 @@ class EnhancedScraper:
             await self.browser_pool.initialize()
             self.logger.info(f"Browser pool initialized with {pool_size} instances")
     
+    def prewarm_connections(self, sources: List[Dict]) -> Thread:
+        """
+        Resolve DNS and open keep-alive connections to known hosts in the background.
+        
+        The warm-up is one HEAD of each host's /robots.txt through the shared
+        session, so the first real fetch skips the DNS lookup and TCP/TLS
+        handshake. It takes no rate-limit token, leaving the first fetch free
+        to go out at once, and it never parses or caches robots rules.
+        
+        Args:
+            sources: Source configurations with a base_url, fetched over HTTP
+            
+        Returns:
+            The daemon thread doing the warm-up
+        """
+        base_urls = [
+            source['base_url'] for source in sources
+            if source.get('base_url')
+        ]
+        
+        def warm():
+            seen = set()
+            for base_url in base_urls:
+                parsed_url = urlparse(base_url)
+                domain = _netloc(base_url)
+                if not domain or domain in seen:
+                    continue
+                seen.add(domain)
+                try:
+                    socket.getaddrinfo(parsed_url.hostname, parsed_url.port or 443)
+                    warm_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
+                    with self._get_host_semaphore(domain):
+                        self.session.head(
+                            warm_url,
+                            headers={'User-Agent': self.robots_user_agent},
+                            timeout=10,
+                            allow_redirects=False,
+                            verify=self.politeness_config.get('ssl_verify', False)
+                        ).close()
+                except Exception as e:
+                    self.logger.debug(f"Connection pre-warm failed for {domain}: {e}")
+        
+        thread = Thread(target=warm, name="connection-prewarm", daemon=True)
+        thread.start()
+        return thread
+    
     def _get_next_user_agent(self) -> str:
         """Get next user agent in rotation."""
         if self.politeness_config.get('rotate_user_agents', True):
-            ua = self.user_agents[self.current_ua_index]
-            self.current_ua_index = (self.current_ua_index + 1) % len(self.user_agents)
-            return ua
+            return next(self._ua_cycle)
         return self.user_agents[0]
     
     def _should_respect_robots(self, url: str, source_config: Dict = None) -> bool:
@@ -154,58 +475,253 @@ class EnhancedScraper:
         return True
     
     def _get_domain_delay(self, domain: str) -> float:
-        """Get delay for specific domain."""
-        return self.domain_delays.get(domain, self.domain_delays.get('default', 0.3))
+        """Get delay for specific domain, matching subdomains of configured entries."""
+        while domain:
+            if domain in self.domain_delays:
+                return self.domain_delays[domain]
+            domain = domain.partition('.')[2]
+        return self.domain_delays.get('default', 0.3)
+    
+    def _get_domain_policy(self, domain: str) -> DomainPolicy:
+        """Get the rate-limit policy for a domain, resolving it on first use."""
+        policy = self._domain_policies.get(domain)
+        if policy is None:
+            delay = max(self._get_domain_delay(domain), self.crawl_delays.get(domain, 0))
+            jitter = self.politeness_config.get('jitter', 0.0)
+            cap = self.politeness_config.get('max_delay', delay + jitter)
+            policy = DomainPolicy(int(delay * 1e9), int(jitter * 1e9), int(cap * 1e9))
+            self._domain_policies[domain] = policy
+        return policy
     
-    def _apply_rate_limiting(self, url: str):
-        """Apply rate limiting based on domain."""
-        domain = urlparse(url).netloc
-        delay = self._get_domain_delay(domain)
+    def _get_host_semaphore(self, domain: str) -> BoundedSemaphore:
+        """Get the semaphore capping concurrent requests to a domain."""
+        with self._rate_lock:
+            semaphore = self._host_semaphores.get(domain)
+            if semaphore is None:
+                semaphore = BoundedSemaphore(self.max_concurrent_per_domain)
+                self._host_semaphores[domain] = semaphore
+            return semaphore
+    
+    def _apply_rate_limiting(self, url: str, domain: str = None):
+        """
+        Apply rate limiting based on domain.
         
-        if domain in self.last_request_times:
-            elapsed = time.time() - self.last_request_times[domain]
-            if elapsed < delay:
-                sleep_time = delay - elapsed
-                self.logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s for {domain}")
-                time.sleep(sleep_time)
+        Each domain has its own token bucket refilled at the domain's delay,
+        holding up to rate_limit_burst tokens. Callers reserve a token and sleep
+        outside any lock, so concurrent workers to the same domain are spaced
+        out while other domains proceed unimpeded.
+        """
+        domain = domain or _netloc(url)
+        policy = self._get_domain_policy(domain)
+        limiter = self.domain_limiters.get(domain)
+        if limiter is None:
+            with self._rate_lock:
+                limiter = self.domain_limiters.get(domain)
+                if limiter is None:
+                    limiter = TokenBucket(policy.delay_ns, self.rate_limit_burst)
+                    self.domain_limiters[domain] = limiter
         
-        self.last_request_times[domain] = time.time()
+        jitter_ns = 0
+        if policy.jitter_ns:
+            jitter_ns = min(random.randrange(policy.jitter_ns), max(policy.cap_ns - policy.delay_ns, 0))
+        
+        sleep_time = limiter.reserve(jitter_ns)
+        if sleep_time > 0:
+            self.logger.debug("Rate limiting: sleeping %.2fs for %s", sleep_time, domain)
+            time.sleep(sleep_time)
     
-    def check_robots_txt(self, url: str, source_config: Dict = None) -> bool:
-        """Check if URL is allowed by robots.txt."""
+    def check_robots_txt(self, url: str, source_config: Dict = None,
+                         parsed_url: ParseResult = None) -> bool:
+        """Check if URL is allowed by robots.txt, reusing parsed_url when the caller has one."""
         if not self._should_respect_robots(url, source_config):
             return True
         
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc
-        
-        if domain not in self.robots_parsers:
-            robots_url = urljoin(url, '/robots.txt')
-            try:
-                response = self.session.get(robots_url, timeout=10)
-                if response.status_code == 200:
-                    self.robots_parsers[domain] = Protego.parse(response.text)
-                else:
-                    self.robots_parsers[domain] = None  # No robots.txt
-            except Exception as e:
-                self.logger.debug(f"Could not fetch robots.txt for {domain}: {e}")
-                self.robots_parsers[domain] = None
+        parsed_url = parsed_url or urlparse(url)
+        domain = parsed_url.netloc.lower()
         
-        robots_parser = self.robots_parsers[domain]
-        if robots_parser:
-            user_agent = self._get_next_user_agent()
-            return robots_parser.can_fetch(url, user_agent)
+        if self._get_robots_parser(url, domain, source_config):
+            path = parsed_url.path or '/'
+            if parsed_url.query:
+                path = f"{path}?{parsed_url.query}"
+            return self._robots_allowed(domain, path, self.robots_user_agent,
+                                        self._robots_generation[domain])
         
         return True  # No robots.txt means allowed
     
+    def _get_robots_parser(self, url: str, domain: str,
+                           source_config: Dict = None) -> Optional[Protego]:
+        """
+        Get a domain's robots.txt rules, reloading them once they expire.
+        
+        Rules are held for robots_cache_ttl. If a reload fails, the previous
+        rules are kept and the load is retried after robots_retry_interval
+        instead of treating the domain as unrestricted for the rest of the run.
+        A Crawl-delay is applied only when robots.txt is respected for the URL.
+        """
+        now = time.monotonic()
+        if now < self._robots_expiry.get(domain, 0):
+            return self.robots_parsers.get(domain)
+        
+        previous = self.robots_parsers.get(domain)
+        try:
+            parser = self._load_robots_parser(url, domain)
+            ttl = self.robots_cache_ttl
+        except NetworkError as e:
+            self.logger.debug(f"Could not fetch robots.txt for {domain}: {e}")
+            parser = previous
+            ttl = self.robots_retry_interval
+        
+        if parser is not previous or domain not in self._robots_generation:
+            self._robots_generation[domain] = self._robots_generation.get(domain, 0) + 1
+            if self._should_respect_robots(url, source_config):
+                self._update_crawl_delay(domain, parser)
+        self.robots_parsers[domain] = parser
+        self._robots_expiry[domain] = now + ttl
+        return parser
+    
+    def _update_crawl_delay(self, domain: str, parser: Optional[Protego]):
+        """Apply a robots.txt Crawl-delay to the domain's rate limit."""
+        crawl_delay = (parser.crawl_delay(self.robots_user_agent) if parser else None) or 0
+        if crawl_delay == self.crawl_delays.get(domain, 0):
+            return
+        
+        self.crawl_delays[domain] = crawl_delay
+        self._domain_policies.pop(domain, None)
+        limiter = self.domain_limiters.get(domain)
+        if limiter is not None:
+            limiter.set_interval(self._get_domain_policy(domain).delay_ns, self.rate_limit_burst)
+        if crawl_delay:
+            self.logger.info(f"Honoring robots.txt Crawl-delay of {crawl_delay}s for {domain}")
+    
+    def _robots_cache_paths(self, domain: str):
+        """Get the cached robots.txt body and metadata paths for a domain."""
+        safe_domain = domain.replace(':', '_')
+        return (self.robots_cache_dir / f"{safe_domain}.txt",
+                self.robots_cache_dir / f"{safe_domain}.meta.json")
+    
+    def _write_robots_cache(self, path: Path, content: str):
+        """Atomically write a robots cache file, ignoring disk errors."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(path.suffix + '.tmp')
+            temp_path.write_text(content, encoding='utf-8')
+            os.replace(temp_path, path)
+        except OSError as e:
+            self.logger.debug(f"Could not write robots cache {path}: {e}")
+    
+    def _load_robots_parser(self, url: str, domain: str) -> Optional[Protego]:
+        """
+        Load robots.txt rules for a domain.
+        
+        A cached copy younger than robots_cache_ttl is used without any request;
+        an older one is revalidated with If-None-Match/If-Modified-Since so an
+        unchanged file costs a bodiless 304. A 404/410 is cached as "no
+        robots.txt" for the same TTL, and a 401/403 is treated as disallowing
+        everything.
+        
+        Returns:
+            Parsed rules, or None when the domain has no robots.txt
+        
+        Raises:
+            NetworkError: If robots.txt could not be retrieved
+        """
+        body_path, meta_path = self._robots_cache_paths(domain)
+        
+        meta = {}
+        try:
+            if meta_path.exists():
+                meta = json.loads(meta_path.read_text(encoding='utf-8'))
+                if time.time() - meta.get('fetched_at', 0) < self.robots_cache_ttl:
+                    if meta.get('missing'):
+                        return None
+                    if body_path.exists():
+                        return Protego.parse(body_path.read_text(encoding='utf-8'))
+                if not body_path.exists():
+                    meta = {}
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Ignoring unreadable robots cache for {domain}: {e}")
+            meta = {}
+        
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        
+        robots_url = urljoin(url, '/robots.txt')
+        try:
+            response = self.session.get(robots_url, headers=headers, timeout=10, stream=True)
+            # Read at most ROBOTS_MAX_BYTES so oversized files stay cheap to parse
+            body = bytearray()
+            with response:
+                if response.status_code == 200:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        body += chunk
+                        if len(body) >= ROBOTS_MAX_BYTES:
+                            break
+            
+            if response.status_code == 304 and meta:
+                meta['fetched_at'] = time.time()
+                self._write_robots_cache(meta_path, json.dumps(meta))
+                return Protego.parse(body_path.read_text(encoding='utf-8'))
+            
+            if response.status_code == 200:
+                body = bytes(body[:ROBOTS_MAX_BYTES]).decode('utf-8', errors='replace')
+                self._write_robots_cache(body_path, body)
+                self._write_robots_cache(meta_path, json.dumps({
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'fetched_at': time.time()
+                }))
+                return Protego.parse(body)
+            
+            if response.status_code >= 500:
+                raise NetworkError(f"robots.txt returned HTTP {response.status_code}")
+            
+            if response.status_code in (401, 403):
+                self.logger.info(f"robots.txt for {domain} is forbidden (HTTP {response.status_code}), treating as disallow-all")
+                return Protego.parse(ROBOTS_DISALLOW_ALL)
+            
+            if response.status_code in (404, 410):
+                # Remember the absence so later runs skip the request until the TTL lapses
+                self._write_robots_cache(meta_path, json.dumps({
+                    'missing': True,
+                    'fetched_at': time.time()
+                }))
+            
+            return None  # No robots.txt
+            
+        except requests.exceptions.RequestException as e:
+            raise NetworkError(f"robots.txt request failed: {e}")
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Could not read robots.txt for {domain}: {e}")
+            return None
+    
+    def _robots_allowed_uncached(self, domain: str, path: str, user_agent: str,
+                                 generation: int) -> bool:
+        """
+        Ask the domain's robots.txt parser whether a path may be fetched.
+        
+        generation only keys the memo so decisions from replaced rules are not reused.
+        """
+        # Protego only matches on path and query, so scheme/fragment don't matter
+        return self.robots_parsers[domain].can_fetch(f"https://{domain}{path}", user_agent)
+    
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((requests.RequestException, NetworkError))
+        wait=_retry_wait,
+        retry=retry_if_exception(_is_retryable)
     )
-    def _fetch_http(self, url: str, source_config: Dict = None) -> requests.Response:
-        """Fetch URL using HTTP requests with retries."""
-        self._apply_rate_limiting(url)
+    def _fetch_http(self, url: str, source_config: Dict = None, domain: str = None) -> requests.Response:
+        """
+        Fetch URL using HTTP requests with retries.
+        
+        The body is streamed and buffered only up to max_content_bytes; larger
+        or media responses raise a non-retryable HTTPStatusError instead of
+        filling memory.
+        """
+        domain = domain or _netloc(url)
+        self._apply_rate_limiting(url, domain)
         
         headers = {
             'User-Agent': self._get_next_user_agent(),
@@ -219,24 +735,99 @@ class EnhancedScraper:
         
         timeout = self.politeness_config.get('timeout', 60)
         
+        if self.http2_client is not None:
+            response = self._fetch_http2(url, headers, timeout, domain, self.max_content_bytes)
+        else:
+            try:
+                with self._get_host_semaphore(domain):
+                    response = self.session.get(
+                        url,
+                        headers=headers,
+                        timeout=timeout,
+                        allow_redirects=True,
+                        stream=True,
+                        verify=self.politeness_config.get('ssl_verify', False)
+                    )
+                    with response:
+                        # Error statuses are decided from headers, before any body is read
+                        handler = _get_status_handler(response.status_code)
+                        if handler is not None:
+                            handler(response, url)
+                        self._read_capped(response, url, self.max_content_bytes)
+            except requests.exceptions.RequestException as e:
+                raise NetworkError(f"Request failed: {e}")
+        
+        self._resolve_encoding(response)
+        return response
+    
+    def _read_capped(self, response: requests.Response, url: str, max_bytes: int):
+        """Buffer a streamed body into response.content, aborting past max_bytes."""
+        response._content = _buffer_capped(response.headers, response.status_code,
+                                           response.iter_content(chunk_size=65536), url, max_bytes)
+    
+    def _fetch_http2(self, url: str, headers: Dict[str, str], timeout: float, domain: str,
+                     max_bytes: int) -> requests.Response:
+        """
+        Issue a GET through the HTTP/2 client, returned as a requests.Response.
+        
+        Status handling, the media-type skip and the max_bytes cap match the
+        HTTP/1.1 path, and the result has the same surface (str url, content,
+        encoding, headers) so callers never see an httpx object.
+        """
+        import httpx
+        
+        # Connection management is per-stream in HTTP/2
+        headers = {k: v for k, v in headers.items() if k != 'Connection'}
         try:
-            response = self.session.get(
-                url,
-                headers=headers,
-                timeout=timeout,
-                allow_redirects=True,
-                verify=self.politeness_config.get('ssl_verify', False)
-            )
-            response.raise_for_status()
-            return response
-            
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code in [403, 404]:
-                raise NetworkError(f"HTTP {e.response.status_code}: {e}")
-            else:
-                raise NetworkError(f"HTTP error: {e}")
-        except requests.exceptions.RequestException as e:
+            with self._get_host_semaphore(domain):
+                with self.http2_client.stream(
+                    'GET',
+                    url,
+                    headers=headers,
+                    timeout=httpx.Timeout(timeout, connect=5.0),
+                    follow_redirects=True
+                ) as h2_response:
+                    # Error statuses are decided from headers, before any body is read
+                    handler = _get_status_handler(h2_response.status_code)
+                    if handler is not None:
+                        handler(h2_response, url)
+                    body = _buffer_capped(h2_response.headers, h2_response.status_code,
+                                          h2_response.iter_bytes(65536), url, max_bytes)
+        except httpx.HTTPError as e:
             raise NetworkError(f"Request failed: {e}")
+        
+        response = requests.Response()
+        response.status_code = h2_response.status_code
+        response.reason = h2_response.reason_phrase
+        response.url = str(h2_response.url)
+        response.headers = CaseInsensitiveDict(h2_response.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        return response
+    
+    def _resolve_encoding(self, response: requests.Response):
+        """
+        Pin response.encoding so .text decodes without guessing.
+        
+        Without a declared charset, requests falls back to ISO-8859-1 for text/*
+        or runs chardet over the whole body. Valid UTF-8 is taken as-is; anything
+        else is detected once with charset_normalizer among the encodings
+        Spanish-language sites actually use.
+        """
+        content_type = response.headers.get('Content-Type', '')
+        if 'charset=' in content_type.lower():
+            return
+        
+        content = response.content
+        try:
+            content.decode('utf-8')
+            response.encoding = 'utf-8'
+            return
+        except UnicodeDecodeError:
+            pass
+        
+        best = from_bytes(content, cp_isolation=['utf_8', 'cp1252', 'iso8859_15']).best()
+        response.encoding = best.encoding if best else 'utf-8'
     
     async def _fetch_browser(self, url: str, source_config: Dict = None) -> str:
         """Fetch URL using Playwright browser automation."""
@@ -315,17 +906,21 @@ class EnhancedScraper:
         Returns:
             Response-like object with .text and .status_code attributes
         """
-        self.logger.debug(f"Fetching: {url}")
+        self.logger.debug("Fetching: %s", url)
+        
+        # Parsed once and shared by the robots check, rate limiter and host semaphore
+        parsed_url = urlparse(url)
+        domain = parsed_url.netloc.lower()
         
         # Check robots.txt if required
-        if not self.check_robots_txt(url, source_config):
+        if not self.check_robots_txt(url, source_config, parsed_url):
             raise RobotsBlockedError(f"Blocked by robots.txt: {url}")
         
         # Determine fetch method
         use_browser = force_browser or (source_config and source_config.get('render_js', False))
         
         if use_browser and self.browser_enabled:
-            self.logger.debug(f"Using browser automation for {url}")
+            self.logger.debug("Using browser automation for %s", url)
             try:
                 html_content = self._run_browser_fetch(url, source_config)
                 
@@ -345,36 +940,60 @@ class EnhancedScraper:
                 # Fall back to HTTP
         
         # Use HTTP fetch
-        self.logger.debug(f"Using HTTP requests for {url}")
-        return self._fetch_http(url, source_config)
+        self.logger.debug("Using HTTP requests for %s", url)
+        return self._fetch_http(url, source_config, domain)
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=_retry_wait,
+        retry=retry_if_exception(_is_retryable)
+    )
+    def fetch_stream(self, url: str) -> requests.Response:
+        """
+        Open a streaming GET for a non-HTML resource such as a sitemap.
+        
+        Rate limiting, status handling and retries match _fetch_http, but the body is
+        left unread; use the response as a context manager and read
+        response.raw, which decodes any Content-Encoding.
+        """
+        self._apply_rate_limiting(url)
+        
+        headers = {
+            'User-Agent': self._get_next_user_agent(),
+            'Accept': 'application/xml,text/xml;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+        }
+        
+        try:
+            with self._get_host_semaphore(_netloc(url)):
+                response = self.session.get(
+                    url,
+                    headers=headers,
+                    timeout=self.politeness_config.get('timeout', 60),
+                    allow_redirects=True,
+                    stream=True,
+                    verify=self.politeness_config.get('ssl_verify', False)
+                )
+        except requests.exceptions.RequestException as e:
+            raise NetworkError(f"Request failed: {e}")
+        
+        handler = _get_status_handler(response.status_code)
+        if handler is not None:
+            response.close()
+            handler(response, url)
+        
+        response.raw.decode_content = True
+        return response
     
     def fetch_sitemap(self, sitemap_url: str) -> List[str]:
-        """Fetch and parse sitemap for URLs."""
+        """Fetch and parse sitemap for URLs, parsing as the body streams in."""
         try:
-            response = self._fetch_http(sitemap_url)
-            # Parse sitemap XML
-            import xml.etree.ElementTree as ET
-            
-            urls = []
-            root = ET.fromstring(response.text)
-            
-            # Handle different sitemap namespaces
-            namespaces = {
-                'sitemap': 'http://www.sitemaps.org/schemas/sitemap/0.9'
-            }
-            
-            # Extract URLs from sitemap
-            for url_elem in root.findall('.//sitemap:url', namespaces):
-                loc_elem = url_elem.find('sitemap:loc', namespaces)
-                if loc_elem is not None:
-                    urls.append(loc_elem.text)
-            
-            # If no URLs found, try without namespace
-            if not urls:
-                for url_elem in root.findall('.//url'):
-                    loc_elem = url_elem.find('loc')
-                    if loc_elem is not None:
-                        urls.append(loc_elem.text)
+            with self.fetch_stream(sitemap_url) as response:
+                # Sniff the gzip magic bytes; .xml.gz is often served without Content-Encoding
+                source = io.BufferedReader(response.raw)
+                if source.peek(2)[:2] == b'\x1f\x8b':
+                    source = gzip.GzipFile(fileobj=source)
+                urls = _parse_sitemap(source)
             
             self.logger.info(f"Sitemap {sitemap_url} contained {len(urls)} URLs")
             return urls
@@ -388,6 +1007,8 @@ class EnhancedScraper:
         if self.browser_pool:
             await self.browser_pool.close()
         self.session.close()
+        if self.http2_client is not None:
+            self.http2_client.close()
         self.logger.info("Enhanced scraper closed")
     
     def __del__(self):
@@ -6,9 +6,12 @@ Extends the existing state manager with high-yield harvesting capabilities.
 import sqlite3
 import logging
 import hashlib
+import threading
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from urllib.parse import urlparse
 import json
 from .exceptions import ScrapingError
 
@@ -19,6 +22,8 @@ class EnhancedStateManager:
     Tracks processing state, performance metrics, and data yield.
     """
     
+    MIGRATION_BATCH_SIZE = 5000
+    
     def __init__(self, storage_config: Dict[str, Any]):
         self.storage_config = storage_config
         self.logger = logging.getLogger(__name__)
@@ -27,8 +32,11 @@ class EnhancedStateManager:
         self.db_path = Path(storage_config['state_dir']) / 'enhanced_state.db'
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Connection with enhanced settings
+        # Connection with enhanced settings. The connection is shared by the
+        # orchestrator's worker threads, so every statement sequence and
+        # transaction on it runs under this lock
         self.conn = None
+        self._lock = threading.RLock()
         self._initialize_database()
         
         # Performance tracking
@@ -90,9 +98,11 @@ class EnhancedStateManager:
                 content_type TEXT,
                 has_comments BOOLEAN DEFAULT FALSE,
                 comment_count INTEGER DEFAULT 0,
-                link_discovery_count INTEGER DEFAULT 0
+                link_discovery_count INTEGER DEFAULT 0,
+                host TEXT
             )
         ''')
+        self._migrate_host_column()
         
         # Performance metrics table
         self.conn.execute('''
@@ -163,6 +173,7 @@ class EnhancedStateManager:
             'CREATE INDEX IF NOT EXISTS idx_urls_updated ON urls(updated_at)',
             'CREATE INDEX IF NOT EXISTS idx_urls_priority ON urls(priority_score DESC)',
             'CREATE INDEX IF NOT EXISTS idx_urls_tokens ON urls(token_count)',
+            'CREATE INDEX IF NOT EXISTS idx_urls_host ON urls(host)',
             'CREATE INDEX IF NOT EXISTS idx_performance_timestamp ON performance_metrics(timestamp)',
             'CREATE INDEX IF NOT EXISTS idx_performance_metric ON performance_metrics(metric_name)',
             'CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions(start_time)'
@@ -173,6 +184,69 @@ class EnhancedStateManager:
         
         self.conn.commit()
     
+    @contextmanager
+    def _write_transaction(self):
+        """
+        Run a bulk write inside a single BEGIN IMMEDIATE transaction.
+        
+        Taking the write lock up front avoids lock-upgrade retries against
+        concurrent writers, and the whole batch costs one commit. Holds the
+        manager lock for the duration; nested use joins the outer transaction.
+        """
+        with self._lock:
+            if self.conn.in_transaction:
+                yield
+                return
+            
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield
+            except BaseException:
+                self.conn.rollback()
+                raise
+            else:
+                self.conn.commit()
+    
+    def _migrate_host_column(self):
+        """Add and backfill the host column on databases created before it existed."""
+        columns = {row['name'] for row in self.conn.execute('PRAGMA table_info(urls)')}
+        if 'host' in columns:
+            return
+        
+        self.conn.execute('ALTER TABLE urls ADD COLUMN host TEXT')
+        
+        # Backfill in bounded batches so large state DBs are never held in memory at once
+        backfilled = 0
+        last_id = 0
+        with self._write_transaction():
+            while True:
+                rows = self.conn.execute(
+                    'SELECT id, url FROM urls WHERE id > ? ORDER BY id LIMIT ?',
+                    (last_id, self.MIGRATION_BATCH_SIZE)
+                ).fetchall()
+                if not rows:
+                    break
+                # Rows unpack positionally, avoiding a name lookup per field
+                self.conn.executemany(
+                    'UPDATE urls SET host = ? WHERE id = ?',
+                    [(self._url_host(url), row_id) for row_id, url in rows]
+                )
+                last_id = rows[-1][0]
+                backfilled += len(rows)
+        self.logger.info(f"Backfilled host column for {backfilled} URLs")
+    
+    @staticmethod
+    def _utc_timestamp(moment: Optional[datetime] = None) -> str:
+        """UTC timestamp text matching SQLite's CURRENT_TIMESTAMP, for bind parameters."""
+        moment = moment or datetime.now(timezone.utc)
+        return moment.strftime('%Y-%m-%d %H:%M:%S')
+    
+    @staticmethod
+    def _url_host(url: str) -> str:
+        """Normalized host used for indexed per-domain lookups (lowercase, no www.)."""
+        host = (urlparse(url).hostname or '').lower()
+        return host[4:] if host.startswith('www.') else host
+    
     def add_enhanced_url(self, url: str, source: str, priority_score: float = 1.0,
                         discovered_from: str = None, content_type: str = None) -> bool:
         """
@@ -191,19 +265,17 @@ class EnhancedStateManager:
         try:
             url_hash = hashlib.sha256(url.encode('utf-8')).hexdigest()
             
-            self.conn.execute('''
-                INSERT OR IGNORE INTO urls (
-                    url_hash, url, source, priority_score, 
-                    discovered_from, content_type
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', (url_hash, url, source, priority_score, discovered_from, content_type))
+            with self._write_transaction():
+                cursor = self.conn.execute('''
+                    INSERT OR IGNORE INTO urls (
+                        url_hash, url, source, priority_score, 
+                        discovered_from, content_type, host
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (url_hash, url, source, priority_score, discovered_from, content_type,
+                      self._url_host(url)))
             
             # Check if it was actually inserted
-            if self.conn.total_changes > 0:
-                self.conn.commit()
-                return True
-            else:
-                return False
+            return cursor.rowcount > 0
                 
         except Exception as e:
             self.logger.error(f"Error adding enhanced URL {url}: {e}")
@@ -236,19 +308,21 @@ class EnhancedStateManager:
                 url_data.append((
                     url_hash, url, source, priority_score,
                     discovery_metadata.get('method') if discovery_metadata else None,
-                    discovery_metadata.get('content_type') if discovery_metadata else None
+                    discovery_metadata.get('content_type') if discovery_metadata else None,
+                    self._url_host(url)
                 ))
             
             # Batch insert
-            self.conn.executemany('''
-                INSERT OR IGNORE INTO urls (
-                    url_hash, url, source, priority_score,
-                    discovered_from, content_type
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', url_data)
-            
-            added_count = self.conn.total_changes
-            self.conn.commit()
+            with self._write_transaction():
+                cursor = self.conn.executemany('''
+                    INSERT OR IGNORE INTO urls (
+                        url_hash, url, source, priority_score,
+                        discovered_from, content_type, host
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', url_data)
+                
+                # rowcount covers only this batch; total_changes is cumulative for the connection
+                added_count = cursor.rowcount
             
             # Update source statistics
             self._update_source_stats(source)
@@ -306,7 +380,7 @@ class EnhancedStateManager:
         try:
             update_data = {
                 'status': status,
-                'updated_at': datetime.now()
+                'updated_at': self._utc_timestamp()
             }
             
             if processing_result:
@@ -339,20 +413,19 @@ class EnhancedStateManager:
             set_clause = ', '.join([f"{key} = ?" for key in update_data.keys()])
             values = list(update_data.values()) + [url_hash]
             
-            self.conn.execute(f'''
-                UPDATE urls SET {set_clause} WHERE url_hash = ?
-            ''', values)
-            
-            success = self.conn.total_changes > 0
-            if success:
-                self.conn.commit()
+            with self._write_transaction():
+                cursor = self.conn.execute(f'''
+                    UPDATE urls SET {set_clause} WHERE url_hash = ?
+                ''', values)
                 
-                # Update session stats
-                self.session_stats['urls_processed'] += 1
-                if processing_result and 'token_count' in processing_result:
-                    self.session_stats['tokens_collected'] += processing_result['token_count']
-                if status == 'failed':
-                    self.session_stats['errors_count'] += 1
+                success = cursor.rowcount > 0
+                if success:
+                    # Update session stats
+                    self.session_stats['urls_processed'] += 1
+                    if processing_result and 'token_count' in processing_result:
+                        self.session_stats['tokens_collected'] += processing_result['token_count']
+                    if status == 'failed':
+                        self.session_stats['errors_count'] += 1
             
             return success
             
@@ -372,37 +445,30 @@ class EnhancedStateManager:
             List of URL records with enhanced metadata
         """
         try:
-            cursor = self.conn.execute('''
-                SELECT url_hash, url, source, priority_score, discovered_from,
-                       content_type, retry_count, created_at
-                FROM urls 
-                WHERE status = 'pending' AND priority_score >= ?
-                ORDER BY priority_score DESC, created_at ASC
-                LIMIT ?
-            ''', (min_priority, limit))
-            
-            urls = []
-            for row in cursor.fetchall():
-                urls.append({
-                    'url_hash': row['url_hash'],
-                    'url': row['url'],
-                    'source': row['source'],
-                    'priority_score': row['priority_score'],
-                    'discovered_from': row['discovered_from'],
-                    'content_type': row['content_type'],
-                    'retry_count': row['retry_count'],
-                    'created_at': row['created_at']
-                })
-            
-            # Mark as processing
-            if urls:
-                url_hashes = [url['url_hash'] for url in urls]
-                placeholders = ', '.join(['?' for _ in url_hashes])
-                self.conn.execute(f'''
-                    UPDATE urls SET status = 'processing', updated_at = CURRENT_TIMESTAMP
-                    WHERE url_hash IN ({placeholders})
-                ''', url_hashes)
-                self.conn.commit()
+            # Select and claim in one transaction so concurrent callers never
+            # receive the same pending URLs
+            with self._write_transaction():
+                cursor = self.conn.execute('''
+                    SELECT url_hash, url, source, priority_score, discovered_from,
+                           content_type, retry_count, created_at
+                    FROM urls 
+                    WHERE status = 'pending' AND priority_score >= ?
+                    ORDER BY priority_score DESC, created_at ASC
+                    LIMIT ?
+                ''', (min_priority, limit))
+                
+                # Selected column names are the record keys, so convert each Row in C
+                # rather than looking every field up by name
+                urls = [dict(row) for row in cursor]
+                
+                # Mark as processing; one fixed statement stays in the statement cache
+                # regardless of batch size, with the timestamp computed once
+                if urls:
+                    now = self._utc_timestamp()
+                    self.conn.executemany(
+                        "UPDATE urls SET status = 'processing', updated_at = ? WHERE url_hash = ?",
+                        [(now, url['url_hash']) for url in urls]
+                    )
             
             return urls
             
@@ -412,163 +478,155 @@ class EnhancedStateManager:
     
     def get_enhanced_progress_stats(self) -> Dict[str, Any]:
         """Get enhanced progress statistics with token metrics."""
-        try:
-            # Overall statistics
-            overall_cursor = self.conn.execute('''
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                    SUM(CASE WHEN status = 'processing' THEN 1 ELSE 0 END) as processing,
-                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                    SUM(CASE WHEN status LIKE 'failed%' THEN 1 ELSE 0 END) as failed,
-                    SUM(CASE WHEN status = 'blocked' THEN 1 ELSE 0 END) as blocked,
-                    SUM(token_count) as total_tokens,
-                    AVG(token_count) as avg_tokens_per_url,
-                    SUM(content_size) as total_content_size,
-                    AVG(mexican_score) as avg_mexican_score,
-                    AVG(processing_time_ms) as avg_processing_time
-                FROM urls
-            ''')
-            
-            overall_row = overall_cursor.fetchone()
-            
-            # Source-wise statistics
-            source_cursor = self.conn.execute('''
-                SELECT 
-                    source,
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                    SUM(CASE WHEN status LIKE 'failed%' THEN 1 ELSE 0 END) as failed,
-                    SUM(token_count) as tokens,
-                    AVG(token_count) as avg_tokens,
-                    AVG(mexican_score) as avg_mexican_score,
-                    AVG(priority_score) as avg_priority
-                FROM urls 
-                GROUP BY source
-                ORDER BY tokens DESC
-            ''')
-            
-            sources = {}
-            for row in source_cursor.fetchall():
-                success_rate = (row['completed'] / row['total'] * 100) if row['total'] > 0 else 0
-                sources[row['source']] = {
-                    'total': row['total'],
-                    'completed': row['completed'],
-                    'failed': row['failed'],
-                    'success_rate': round(success_rate, 1),
-                    'tokens': row['tokens'] or 0,
-                    'avg_tokens': round(row['avg_tokens'] or 0, 1),
-                    'avg_mexican_score': round(row['avg_mexican_score'] or 0, 2),
-                    'avg_priority': round(row['avg_priority'] or 0, 2)
-                }
-            
-            # Domain yield statistics
-            domain_cursor = self.conn.execute('''
-                SELECT 
-                    SUBSTR(url, INSTR(url, '://') + 3) as domain_part,
-                    COUNT(*) as total_urls,
-                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed_urls,
-                    SUM(token_count) as total_tokens,
-                    AVG(token_count) as avg_tokens_per_url
-                FROM urls
-                WHERE url LIKE 'http%'
-                GROUP BY domain_part
-                HAVING total_urls >= 5
-                ORDER BY total_tokens DESC
-                LIMIT 20
-            ''')
-            
-            domains = {}
-            for row in domain_cursor.fetchall():
-                domain = row['domain_part'].split('/')[0]  # Extract just domain
-                yield_efficiency = (row['total_tokens'] / row['total_urls']) if row['total_urls'] > 0 else 0
+        with self._lock:
+            try:
+                # Overall statistics and performance metrics in a single table scan
+                overall_cursor = self.conn.execute('''
+                    SELECT 
+                        COUNT(*) as total,
+                        SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
+                        SUM(CASE WHEN status = 'processing' THEN 1 ELSE 0 END) as processing,
+                        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
+                        SUM(CASE WHEN status GLOB 'failed*' THEN 1 ELSE 0 END) as failed,
+                        SUM(CASE WHEN status = 'blocked' THEN 1 ELSE 0 END) as blocked,
+                        SUM(token_count) as total_tokens,
+                        AVG(token_count) as avg_tokens_per_url,
+                        SUM(content_size) as total_content_size,
+                        AVG(mexican_score) as avg_mexican_score,
+                        AVG(processing_time_ms) as avg_processing_time,
+                        AVG(CASE WHEN token_count > 0 THEN token_count ELSE NULL END) as tokens_per_success,
+                        COUNT(CASE WHEN status = 'completed' AND created_at > datetime('now', '-1 hour') THEN 1 END) as recent_successes,
+                        COUNT(CASE WHEN status = 'completed' AND created_at > datetime('now', '-1 day') THEN 1 END) as daily_successes
+                    FROM urls
+                ''')
+                
+                overall_row = perf_row = overall_cursor.fetchone()
+                
+                # Source-wise statistics
+                source_cursor = self.conn.execute('''
+                    SELECT 
+                        source,
+                        COUNT(*) as total,
+                        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
+                        SUM(CASE WHEN status GLOB 'failed*' THEN 1 ELSE 0 END) as failed,
+                        SUM(token_count) as tokens,
+                        AVG(token_count) as avg_tokens,
+                        AVG(mexican_score) as avg_mexican_score,
+                        AVG(priority_score) as avg_priority
+                    FROM urls 
+                    GROUP BY source
+                    ORDER BY tokens DESC
+                ''')
+                
+                sources = {}
+                for row in source_cursor:
+                    success_rate = (row['completed'] / row['total'] * 100) if row['total'] > 0 else 0
+                    sources[row['source']] = {
+                        'total': row['total'],
+                        'completed': row['completed'],
+                        'failed': row['failed'],
+                        'success_rate': round(success_rate, 1),
+                        'tokens': row['tokens'] or 0,
+                        'avg_tokens': round(row['avg_tokens'] or 0, 1),
+                        'avg_mexican_score': round(row['avg_mexican_score'] or 0, 2),
+                        'avg_priority': round(row['avg_priority'] or 0, 2)
+                    }
+                
+                # Domain yield statistics
+                domain_cursor = self.conn.execute('''
+                    SELECT 
+                        host,
+                        COUNT(*) as total_urls,
+                        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed_urls,
+                        SUM(token_count) as total_tokens,
+                        AVG(token_count) as avg_tokens_per_url
+                    FROM urls
+                    WHERE host IS NOT NULL AND host != ''
+                    GROUP BY host
+                    HAVING total_urls >= 5
+                    ORDER BY total_tokens DESC
+                    LIMIT 20
+                ''')
                 
-                domains[domain] = {
-                    'total_urls': row['total_urls'],
-                    'completed_urls': row['completed_urls'],
-                    'total_tokens': row['total_tokens'] or 0,
-                    'avg_tokens_per_url': round(row['avg_tokens_per_url'] or 0, 1),
-                    'yield_efficiency': round(yield_efficiency, 1)
+                domains = {}
+                for row in domain_cursor:
+                    domain = row['host']
+                    yield_efficiency = (row['total_tokens'] / row['total_urls']) if row['total_urls'] > 0 else 0
+                    
+                    domains[domain] = {
+                        'total_urls': row['total_urls'],
+                        'completed_urls': row['completed_urls'],
+                        'total_tokens': row['total_tokens'] or 0,
+                        'avg_tokens_per_url': round(row['avg_tokens_per_url'] or 0, 1),
+                        'yield_efficiency': round(yield_efficiency, 1)
+                    }
+                
+                # Calculate progress percentages
+                total_tokens = overall_row['total_tokens'] or 0
+                target_tokens = 1000000000  # 1 billion target
+                progress_pct = (total_tokens / target_tokens) * 100
+                
+                return {
+                    'overall': {
+                        'total': overall_row['total'],
+                        'pending': overall_row['pending'],
+                        'processing': overall_row['processing'],
+                        'completed': overall_row['completed'],
+                        'failed': overall_row['failed'],
+                        'blocked': overall_row['blocked'],
+                        'success_rate': round((overall_row['completed'] / overall_row['total'] * 100) if overall_row['total'] > 0 else 0, 1)
+                    },
+                    'tokens': {
+                        'total_tokens': total_tokens,
+                        'avg_tokens_per_url': round(overall_row['avg_tokens_per_url'] or 0, 1),
+                        'tokens_per_success': round(perf_row['tokens_per_success'] or 0, 1),
+                        'target_tokens': target_tokens,
+                        'progress_percentage': round(progress_pct, 2)
+                    },
+                    'content': {
+                        'total_size_bytes': overall_row['total_content_size'] or 0,
+                        'total_size_mb': round((overall_row['total_content_size'] or 0) / (1024*1024), 2),
+                        'avg_mexican_score': round(overall_row['avg_mexican_score'] or 0, 2),
+                        'avg_processing_time_ms': round(overall_row['avg_processing_time'] or 0, 1)
+                    },
+                    'performance': {
+                        'recent_successes_1h': perf_row['recent_successes'],
+                        'daily_successes': perf_row['daily_successes'],
+                        'processing_rate_per_hour': perf_row['recent_successes'],
+                        'session_stats': self.session_stats
+                    },
+                    'sources': sources,
+                    'top_domains': domains
                 }
-            
-            # Performance metrics
-            performance_cursor = self.conn.execute('''
-                SELECT 
-                    AVG(CASE WHEN token_count > 0 THEN token_count ELSE NULL END) as tokens_per_success,
-                    COUNT(CASE WHEN status = 'completed' AND created_at > datetime('now', '-1 hour') THEN 1 END) as recent_successes,
-                    COUNT(CASE WHEN status = 'completed' AND created_at > datetime('now', '-1 day') THEN 1 END) as daily_successes
-                FROM urls
-            ''')
-            
-            perf_row = performance_cursor.fetchone()
-            
-            # Calculate progress percentages
-            total_tokens = overall_row['total_tokens'] or 0
-            target_tokens = 1000000000  # 1 billion target
-            progress_pct = (total_tokens / target_tokens) * 100
-            
-            return {
-                'overall': {
-                    'total': overall_row['total'],
-                    'pending': overall_row['pending'],
-                    'processing': overall_row['processing'],
-                    'completed': overall_row['completed'],
-                    'failed': overall_row['failed'],
-                    'blocked': overall_row['blocked'],
-                    'success_rate': round((overall_row['completed'] / overall_row['total'] * 100) if overall_row['total'] > 0 else 0, 1)
-                },
-                'tokens': {
-                    'total_tokens': total_tokens,
-                    'avg_tokens_per_url': round(overall_row['avg_tokens_per_url'] or 0, 1),
-                    'tokens_per_success': round(perf_row['tokens_per_success'] or 0, 1),
-                    'target_tokens': target_tokens,
-                    'progress_percentage': round(progress_pct, 2)
-                },
-                'content': {
-                    'total_size_bytes': overall_row['total_content_size'] or 0,
-                    'total_size_mb': round((overall_row['total_content_size'] or 0) / (1024*1024), 2),
-                    'avg_mexican_score': round(overall_row['avg_mexican_score'] or 0, 2),
-                    'avg_processing_time_ms': round(overall_row['avg_processing_time'] or 0, 1)
-                },
-                'performance': {
-                    'recent_successes_1h': perf_row['recent_successes'],
-                    'daily_successes': perf_row['daily_successes'],
-                    'processing_rate_per_hour': perf_row['recent_successes'],
-                    'session_stats': self.session_stats
-                },
-                'sources': sources,
-                'top_domains': domains
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error getting enhanced progress stats: {e}")
-            return {'error': str(e)}
+                
+            except Exception as e:
+                self.logger.error(f"Error getting enhanced progress stats: {e}")
+                return {'error': str(e)}
     
     def _update_source_stats(self, source: str):
         """Update source statistics table."""
         try:
-            self.conn.execute('''
-                INSERT OR REPLACE INTO source_stats (
-                    source_name, last_updated, total_urls, completed_urls, 
-                    failed_urls, total_tokens, avg_mexican_score, 
-                    avg_processing_time_ms, success_rate
-                )
-                SELECT 
-                    source as source_name,
-                    CURRENT_TIMESTAMP as last_updated,
-                    COUNT(*) as total_urls,
-                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed_urls,
-                    SUM(CASE WHEN status LIKE 'failed%' THEN 1 ELSE 0 END) as failed_urls,
-                    SUM(token_count) as total_tokens,
-                    AVG(mexican_score) as avg_mexican_score,
-                    AVG(processing_time_ms) as avg_processing_time_ms,
-                    CAST(SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) AS REAL) / COUNT(*) * 100 as success_rate
-                FROM urls 
-                WHERE source = ?
-                GROUP BY source
-            ''', (source,))
-            
-            self.conn.commit()
+            with self._write_transaction():
+                self.conn.execute('''
+                    INSERT OR REPLACE INTO source_stats (
+                        source_name, last_updated, total_urls, completed_urls, 
+                        failed_urls, total_tokens, avg_mexican_score, 
+                        avg_processing_time_ms, success_rate
+                    )
+                    SELECT 
+                        source as source_name,
+                        CURRENT_TIMESTAMP as last_updated,
+                        COUNT(*) as total_urls,
+                        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed_urls,
+                        SUM(CASE WHEN status GLOB 'failed*' THEN 1 ELSE 0 END) as failed_urls,
+                        SUM(token_count) as total_tokens,
+                        AVG(mexican_score) as avg_mexican_score,
+                        AVG(processing_time_ms) as avg_processing_time_ms,
+                        CAST(SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) AS REAL) / COUNT(*) * 100 as success_rate
+                    FROM urls 
+                    WHERE source = ?
+                    GROUP BY source
+                ''', (source,))
             
         except Exception as e:
             self.logger.debug(f"Error updating source stats for {source}: {e}")
@@ -579,13 +637,12 @@ class EnhancedStateManager:
         try:
             additional_json = json.dumps(additional_data) if additional_data else None
             
-            self.conn.execute('''
-                INSERT INTO performance_metrics 
-                (metric_name, metric_value, source, additional_data)
-                VALUES (?, ?, ?, ?)
-            ''', (metric_name, value, source, additional_json))
-            
-            self.conn.commit()
+            with self._write_transaction():
+                self.conn.execute('''
+                    INSERT INTO performance_metrics 
+                    (metric_name, metric_value, source, additional_data)
+                    VALUES (?, ?, ?, ?)
+                ''', (metric_name, value, source, additional_json))
             
         except Exception as e:
             self.logger.debug(f"Error recording performance metric: {e}")
@@ -593,21 +650,20 @@ class EnhancedStateManager:
     def cleanup_old_data(self, days_old: int = 30):
         """Clean up old performance metrics and completed URLs."""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days_old)
-            
-            # Clean old performance metrics
-            self.conn.execute('''
-                DELETE FROM performance_metrics 
-                WHERE timestamp < ?
-            ''', (cutoff_date,))
-            
-            # Clean very old completed URLs (keep recent for deduplication)
-            self.conn.execute('''
-                DELETE FROM urls 
-                WHERE status = 'completed' AND updated_at < ?
-            ''', (cutoff_date,))
-            
-            self.conn.commit()
+            cutoff_date = self._utc_timestamp(datetime.now(timezone.utc) - timedelta(days=days_old))
+            
+            with self._write_transaction():
+                # Clean old performance metrics
+                self.conn.execute('''
+                    DELETE FROM performance_metrics 
+                    WHERE timestamp < ?
+                ''', (cutoff_date,))
+                
+                # Clean very old completed URLs (keep recent for deduplication)
+                self.conn.execute('''
+                    DELETE FROM urls 
+                    WHERE status = 'completed' AND updated_at < ?
+                ''', (cutoff_date,))
             self.logger.info(f"Cleaned up data older than {days_old} days")
             
         except Exception as e:
@@ -615,9 +671,24 @@ class EnhancedStateManager:
     
     def close(self):
         """Close database connection."""
-        if self.conn:
-            try:
-                self.conn.close()
-                self.logger.info("Enhanced state manager closed")
-            except Exception as e:
-                self.logger.error(f"Error closing enhanced state manager: {e}")
\ No newline at end of file
+        with self._lock:
+            if self.conn:
+                try:
+                    self.conn.close()
+                    self.conn = None
+                    self.logger.info("Enhanced state manager closed")
+                except Exception as e:
+                    self.logger.error(f"Error closing enhanced state manager: {e}")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Single commit path on success; never persist a half-written transaction
+        with self._lock:
+            if self.conn and self.conn.in_transaction:
+                if exc_type is None:
+                    self.conn.commit()
+                else:
+                    self.conn.rollback()
+            self.close()
\ No newline at end of file
@@ -45,4 +45,15 @@ class StateManagementError(ScrapingError):
 
 class NetworkError(ScrapingError):
     """Raised for network-related issues during scraping."""
-    pass
\ No newline at end of file
+    pass
+
+
+class HTTPStatusError(NetworkError):
+    """Raised when a server answers with an HTTP error status."""
+    
+    def __init__(self, message: str, status_code: int, retryable: bool = True,
+                 retry_after: float = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+        self.retry_after = retry_after
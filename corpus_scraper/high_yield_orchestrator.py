@@ -37,6 +37,11 @@ class HighYieldOrchestrator:
         # Initialize enhanced configuration
         self.config_manager = ConfigManager(config_path, sources_path)
         
+        # Source configs by name, built once instead of scanning the list per URL
+        self._source_configs = {
+            source['name']: source for source in self.config_manager.get_sources()
+        }
+        
         # Initialize enhanced components
         self._initialize_enhanced_components()
         
@@ -79,6 +84,12 @@ class HighYieldOrchestrator:
             self.scraper = EnhancedScraper(politeness_config)
             self.dynamic_scraper = None  # Initialize on demand
             
+            # Warm DNS and connections for HTTP-fetched sources while discovery runs
+            self.scraper.prewarm_connections([
+                source for source in self.config_manager.get_sources()
+                if not source.get('render_js', False)
+            ])
+            
             self.extractor = EnhancedExtractor(extraction_config, validation_config)
             self.saver = EnhancedSaver(storage_config)
             self.state_manager = EnhancedStateManager(storage_config)
@@ -660,13 +671,15 @@ class HighYieldOrchestrator:
                 'error': extraction_result.get('error', 'Extraction failed')
             }
         
+        metadata = extraction_result.get('metadata') or {}
+        
         # Save with enhanced features
         save_result = self.saver.save_enhanced_content(
             content=extraction_result['text'],
             source_name=source,
             url=url,
             html_content=html_content,
-            metadata=extraction_result.get('metadata', {})
+            metadata=metadata
         )
         
         # Process discovered links if dynamic recursion is enabled
@@ -685,7 +698,7 @@ class HighYieldOrchestrator:
                 'snapshot_path': save_result.get('snapshot_path'),
                 'token_count': save_result['token_count'],
                 'content_size': len(extraction_result['text']),
-                'mexican_score': extraction_result.get('metadata', {}).get('mexican_score', 0),
+                'mexican_score': metadata.get('mexican_score', 0),
                 'extraction_method': extraction_result.get('extraction_method', 'enhanced'),
                 'comments_count': extraction_result.get('comments_count', 0),
                 'discovered_links': len(extraction_result.get('discovered_links', []))
@@ -699,11 +712,7 @@ class HighYieldOrchestrator:
     
     def _get_source_config(self, source_name: str) -> Dict[str, Any]:
         """Get source configuration by name."""
-        sources = self.config_manager.get_sources()
-        for source in sources:
-            if source['name'] == source_name:
-                return source
-        return {}  # Default empty config
+        return self._source_configs.get(source_name, {})  # Default empty config
     
     def _queue_discovered_links(self, discovered_links: List[Dict], 
                                parent_source: str, parent_url: str):
@@ -726,7 +735,7 @@ class HighYieldOrchestrator:
             )
             
             if added > 0:
-                self.logger.info(f"Queued {added} high-value discovered links from {parent_url}")
+                self.logger.debug("Queued %d high-value discovered links from %s", added, parent_url)
     
     def run_complete_harvest(self) -> Dict[str, Any]:
         """
@@ -796,6 +805,9 @@ class HighYieldOrchestrator:
                 # DynamicScraperSync cleanup is handled by context manager
                 pass
             
+            if self.youtube_handler:
+                self.youtube_handler.close()
+            
             self.scraper.close()
             self.state_manager.close()
             
@@ -5,6 +5,8 @@ Extracts song lyrics from artists on Letras.com with pagination support.
 
 import logging
 import re
+import concurrent.futures
+import threading
 import requests
 import time
 import unicodedata
@@ -19,11 +21,33 @@ class LetrasScraper:
     and extracts lyrics from individual song pages.
     """
     
-    def __init__(self, scraper=None):
-        """Initialize with an optional scraper instance from the main framework."""
+    def __init__(self, scraper=None, max_workers: int = 4, song_delay: float = 1.5):
+        """Initialize with an optional scraper instance from the main framework.
+        
+        Args:
+            scraper: Optional framework scraper used for fetching
+            max_workers: Number of song pages fetched concurrently per artist
+            song_delay: Minimum seconds between song requests across all workers
+        """
         self.logger = logging.getLogger(__name__)
         self.scraper = scraper
         self.base_url = "https://www.letras.com"
+        self.max_workers = max_workers
+        
+        # Song requests are started on one shared schedule, so extra workers only
+        # overlap response latency and never raise the request rate to the host
+        self.song_delay = song_delay
+        self._song_gate_lock = threading.Lock()
+        self._next_song_request = 0.0
+    
+    def _wait_for_song_slot(self):
+        """Block until this worker may start the next song request."""
+        with self._song_gate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_song_request)
+            self._next_song_request = start + self.song_delay
+        if start > now:
+            time.sleep(start - now)
         
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """
@@ -82,7 +106,7 @@ class LetrasScraper:
                     self.logger.error(f"Error fetching page: {e}")
                     raise Exception(f"Error fetching page: {e}")
             # Parse HTML
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             return soup
         except Exception as e:
             self.logger.error(f"Error fetching {url}: {e}")
@@ -118,7 +142,7 @@ class LetrasScraper:
                         page = browser.new_page()
                         page.goto(url, wait_until='networkidle', timeout=60000)
                         html_content = page.content()
-                        soup = BeautifulSoup(html_content, 'html.parser')
+                        soup = BeautifulSoup(html_content, 'lxml')
                         browser.close()
                 except Exception as e:
                     self.logger.warning(f"Playwright navigation failed: {e}")
@@ -308,13 +332,13 @@ class LetrasScraper:
             
         # Crear el objeto BeautifulSoup
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
         except Exception as e:
             self.logger.error(f"Error parsing artist page HTML: {e}")
             return songs
         
         # First look for song rows with data attributes (current site structure)
-        song_rows = soup.find_all('li', class_=lambda x: x and 'songList-table-row' in x and '--song' in x)
+        song_rows = soup.select('li.songList-table-row--song')
         self.logger.info(f"Found {len(song_rows)} potential song rows on {artist_url}")
         
         # Extract songs from data attributes (modern approach)
@@ -475,9 +499,9 @@ class LetrasScraper:
             result['error'] = f"Failed to fetch song page {song_url}"
             return result
             
-        # Crear el objeto BeautifulSoup con el parser HTML correcto
+        # Crear el objeto BeautifulSoup con el parser lxml (C), mucho más rápido que html.parser
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             self.logger.debug(f"Successfully parsed HTML into BeautifulSoup object")
         except Exception as e:
             self.logger.error(f"Error parsing HTML content: {e}")
@@ -662,16 +686,23 @@ class LetrasScraper:
             songs = self.get_songs_from_artist_page(artist_url)
             result['song_count'] = len(songs)
             
-            # Extract lyrics for each song
-            for song in songs:
+            def extract_song(song):
                 self.logger.info(f"Extracting lyrics for '{song['title']}'")
                 
-                # Be polite with delays between requests
-                time.sleep(1.5)
-                
-                # Extract the lyrics
-                extraction_result = self.extract_lyrics(song['url'])
+                # Be polite: one song request per song_delay across all workers
+                self._wait_for_song_slot()
                 
+                return self.extract_lyrics(song['url'])
+            
+            # Song pages are network-bound, so overlap them; map keeps results in song order
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, self.max_workers),
+                thread_name_prefix="letras-song"
+            ) as executor:
+                extraction_results = list(executor.map(extract_song, songs))
+            
+            # Collect the extracted lyrics for each song
+            for song, extraction_result in zip(songs, extraction_results):
                 if extraction_result['success']:
                     result['successful_extractions'] += 1
                 
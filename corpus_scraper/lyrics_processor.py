@@ -7,11 +7,23 @@ import logging
 import os
 import re
 import json
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Any
 import spacy
 
 
+# Cleanup patterns, compiled once since they run for every song
+_BRACKETED_RE = re.compile(r'\[.*?\]')
+_PARENTHESIZED_RE = re.compile(r'\(.*?\)')
+_TIMESTAMP_RE = re.compile(r'\d{2}:\d{2}')
+_MENTION_RE = re.compile(r'@\w+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_MISSING_SPACE_RE = re.compile(r'([.!?])(\w)')
+_INVALID_FILENAME_RE = re.compile(r'[\\/*?:"<>|]')
+_GENRE_URL_RE = re.compile(r'/([^/]+)/artistas\.html$')
+
+
 class LyricsProcessor:
     """
     Processes extracted lyrics into standardized corpus format.
@@ -62,21 +74,20 @@ class LyricsProcessor:
             return ""
             
         # Remove stage directions often in parentheses or brackets
-        text = re.sub(r'\[.*?\]', '', text)
-        text = re.sub(r'\(.*?\)', '', text)
+        text = _BRACKETED_RE.sub('', text)
+        text = _PARENTHESIZED_RE.sub('', text)
         
         # Remove timestamps and other non-text elements
-        text = re.sub(r'\d{2}:\d{2}', '', text)
+        text = _TIMESTAMP_RE.sub('', text)
         
         # Remove social media mentions
-        text = re.sub(r'@\w+', '', text)
+        text = _MENTION_RE.sub('', text)
         
-        # Remove multiple whitespace characters and normalize line endings
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
+        # Collapse all whitespace, line endings included, to single spaces
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Ensure proper spacing after punctuation
-        text = re.sub(r'([.!?])(\w)', r'\1 \2', text)
+        text = _MISSING_SPACE_RE.sub(r'\1 \2', text)
         
         return text.strip()
     
@@ -104,6 +115,27 @@ class LyricsProcessor:
         
         return sentences
     
+    def _count_words(self, sentences: List[str]) -> int:
+        """Count words in cleaned sentences.
+        
+        _clean_lyrics collapses whitespace to single spaces and sentences are
+        stripped and non-empty, so each has exactly one more word than spaces.
+        
+        Args:
+            sentences: Sentences from _segment_into_sentences
+            
+        Returns:
+            Total word count
+        """
+        return sum(map(str.count, sentences, repeat(' '))) + len(sentences)
+    
+    def _write_file(self, file_path: str, content: str):
+        """Write content with a single write() to a temp file, then move it into place."""
+        temp_path = file_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(content.encode('utf-8'))
+        os.replace(temp_path, file_path)
+    
     def process_lyrics(self, artist_data: Dict[str, Any], include_metadata: bool = True) -> Dict[str, Any]:
         """Process lyrics data for an artist and save to files.
         
@@ -129,13 +161,14 @@ class LyricsProcessor:
         
         # Process each song
         for song in artist_data.get('songs', []):
-            if not song.get('success') or not song.get('lyrics'):
+            lyrics = song.get('lyrics')
+            if not (lyrics and song.get('success')):
                 stats['errors'].append(f"No lyrics for: {song.get('title', 'unknown')}")
                 continue
                 
             try:
                 # Clean lyrics
-                clean_text = self._clean_lyrics(song['lyrics'])
+                clean_text = self._clean_lyrics(lyrics)
                 
                 # Skip if no valid content after cleaning
                 if len(clean_text) < 20:  # Minimum character threshold
@@ -150,6 +183,10 @@ class LyricsProcessor:
                     stats['errors'].append(f"No sentences extracted for: {song.get('title', 'unknown')}")
                     continue
                 
+                # Per-song figures, computed once for both the metadata and the totals
+                sentence_count = len(sentences)
+                word_count = self._count_words(sentences)
+                
                 # Create output text with one blank line between sentences
                 output_text = "\n\n".join(sentences)
                 
@@ -157,29 +194,28 @@ class LyricsProcessor:
                 song_filename = self._get_sanitized_filename(song.get('title', f"song_{len(stats['files_saved'])}"))
                 text_file = os.path.join(artist_path, f"{song_filename}.txt")
                 
-                with open(text_file, 'w', encoding='utf-8') as f:
-                    f.write(output_text)
+                self._write_file(text_file, output_text)
                 
                 # Save metadata if requested
                 if include_metadata:
+                    song_meta = song.get('metadata', {})
                     metadata = {
                         'title': song.get('title', ''),
                         'artist': stats['artist'],
-                        'album': song.get('metadata', {}).get('album', ''),
-                        'language': song.get('metadata', {}).get('language', 'es'),
+                        'album': song_meta.get('album', ''),
+                        'language': song_meta.get('language', 'es'),
                         'url': song.get('url', ''),
-                        'sentence_count': len(sentences),
-                        'word_count': sum(len(s.split()) for s in sentences)
+                        'sentence_count': sentence_count,
+                        'word_count': word_count
                     }
                     
                     meta_file = os.path.join(artist_path, f"{song_filename}_meta.json")
-                    with open(meta_file, 'w', encoding='utf-8') as f:
-                        json.dump(metadata, f, ensure_ascii=False, indent=2)
+                    self._write_file(meta_file, json.dumps(metadata, ensure_ascii=False, indent=2))
                 
                 # Update stats
                 stats['processed_songs'] += 1
-                stats['total_sentences'] += len(sentences)
-                stats['total_words'] += sum(len(s.split()) for s in sentences)
+                stats['total_sentences'] += sentence_count
+                stats['total_words'] += word_count
                 stats['files_saved'].append(text_file)
                 
             except Exception as e:
@@ -197,8 +233,7 @@ class LyricsProcessor:
         }
         
         summary_file = os.path.join(artist_path, "_summary.json")
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        self._write_file(summary_file, json.dumps(summary, ensure_ascii=False, indent=2))
         
         self.logger.info(
             f"Processed {stats['processed_songs']} songs with "
@@ -245,9 +280,7 @@ class LyricsProcessor:
         # Save genre summary
         genre_name = self._extract_genre_name(genre_data.get('genre_url', ''))
         summary_file = os.path.join(self.output_dir, f"{genre_name}_summary.json")
-        
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, ensure_ascii=False, indent=2)
+        self._write_file(summary_file, json.dumps(stats, ensure_ascii=False, indent=2))
         
         self.logger.info(
             f"Processed {stats['songs_processed']} songs from {stats['artists_processed']} artists "
@@ -267,9 +300,9 @@ class LyricsProcessor:
             Sanitized filename
         """
         # Replace invalid filename characters
-        name = re.sub(r'[\\/*?:"<>|]', '', name)
+        name = _INVALID_FILENAME_RE.sub('', name)
         # Replace spaces with underscores
-        name = re.sub(r'\s+', '_', name.strip())
+        name = _WHITESPACE_RE.sub('_', name.strip())
         # Ensure ASCII only
         name = name.encode('ascii', 'ignore').decode('ascii')
         # Limit length
@@ -287,7 +320,7 @@ class LyricsProcessor:
             Genre name
         """
         # Try to extract genre from URL
-        match = re.search(r'/([^/]+)/artistas\.html$', url)
+        match = _GENRE_URL_RE.search(url)
         if match:
             return match.group(1)
         
@@ -4,6 +4,7 @@ Efficiently extracts posts and comments from Mexican subreddits using PRAW.
 """
 
 import logging
+import sys
 import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
@@ -24,8 +25,8 @@ class RedditHandler:
         self.reddit = None
         self.geographic_filter = GeographicFilter()
         
-        # Mexican subreddits of interest
-        self.mexican_subreddits = [
+        # Mexican subreddits of interest (overridable via config)
+        subreddits = self.config.get('subreddits') or [
             'mexico',
             'LigaMX',
             'mexicocity', 
@@ -37,6 +38,7 @@ class RedditHandler:
             'UNAM',
             'mexicocirclejerk'
         ]
+        self.mexican_subreddits = tuple(sys.intern(name) for name in subreddits)
         
         # Content quality thresholds
         self.min_score = 1  # Minimum upvotes
@@ -142,25 +144,31 @@ class RedditHandler:
                 if not post_text:
                     continue
                 
+                post_url = f"https://reddit.com{post.permalink}"
+                
                 # Check if content is Mexican/Spanish
                 is_mexican, geo_score, reasons = self.geographic_filter.is_mexican_content(
-                    post_text, post.title, f"https://reddit.com{post.permalink}", min_score=1.0
+                    post_text, post.title, post_url, min_score=1.0
                 )
                 
                 # More lenient for social media content
                 if not is_mexican and geo_score.total_score < 1.0:
                     continue
                 
+                # Interned: the same subreddit/author strings repeat across thousands of items
+                subreddit_str = sys.intern(str(post.subreddit))
+                author_str = sys.intern(str(post.author)) if post.author else '[deleted]'
+                
                 # Create content item for post
                 content_item = {
                     'type': 'reddit_post',
                     'title': post.title,
                     'text': post_text,
-                    'url': f"https://reddit.com{post.permalink}",
+                    'url': post_url,
                     'score': post.score,
                     'created_utc': datetime.fromtimestamp(post.created_utc),
-                    'subreddit': str(post.subreddit),
-                    'author': str(post.author) if post.author else '[deleted]',
+                    'subreddit': subreddit_str,
+                    'author': author_str,
                     'num_comments': post.num_comments,
                     'mexican_score': geo_score.total_score,
                     'post_type': post_type
@@ -170,7 +178,7 @@ class RedditHandler:
                 
                 # Extract comments if enabled
                 if self.config.get('crawl_comments', True):
-                    comments = self._extract_comments(post)
+                    comments = self._extract_comments(post, post_url)
                     content_items.extend(comments)
                 
             except Exception as e:
@@ -200,11 +208,15 @@ class RedditHandler:
         
         return full_text.strip()
     
-    def _extract_comments(self, post) -> List[Dict]:
-        """Extract comments from a Reddit post."""
+    def _extract_comments(self, post, post_url: str) -> List[Dict]:
+        """Extract comments from a Reddit post whose canonical URL is post_url."""
         comments = []
         comment_limit = self.config.get('api_limit', 1000) // 10  # Limit comments per post
         
+        subreddit_str = sys.intern(str(post.subreddit))
+        title = post.title
+        title_preview = f"{title[:50]}..." if len(title) > 50 else title
+        
         try:
             # Expand all comments
             post.comments.replace_more(limit=self.config.get('comment_depth', 3))
@@ -230,7 +242,7 @@ class RedditHandler:
                     
                     # Check if comment is Spanish/Mexican
                     is_mexican, geo_score, reasons = self.geographic_filter.is_mexican_content(
-                        comment.body, "", f"https://reddit.com{post.permalink}", min_score=0.5
+                        comment.body, "", post_url, min_score=0.5
                     )
                     
                     # Very lenient for comments
@@ -242,14 +254,14 @@ class RedditHandler:
                     # Create comment content item
                     comment_item = {
                         'type': 'reddit_comment',
-                        'title': f"Comentario en: {post.title[:50]}...",
+                        'title': f"Comentario en: {title_preview}",
                         'text': comment.body,
-                        'url': f"https://reddit.com{post.permalink}#{comment.id}",
+                        'url': f"{post_url}#{comment.id}",
                         'score': getattr(comment, 'score', 0),
                         'created_utc': datetime.fromtimestamp(comment.created_utc),
-                        'subreddit': str(post.subreddit),
-                        'author': str(comment.author) if comment.author else '[deleted]',
-                        'parent_post_title': post.title,
+                        'subreddit': subreddit_str,
+                        'author': sys.intern(str(comment.author)) if comment.author else '[deleted]',
+                        'parent_post_title': title,
                         'mexican_score': geo_score.total_score,
                         'post_type': 'comment'
                     }
@@ -7,9 +7,13 @@ import logging
 import time
 import os
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import feedparser
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from lxml import etree
 from urllib.parse import urljoin, urlparse
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from .exceptions import NetworkError
@@ -17,6 +21,11 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+RSS_USER_AGENT = 'Mexican Spanish Corpus RSS Reader/1.0 (Academic Research)'
+feedparser.USER_AGENT = RSS_USER_AGENT
+
 
 class RSSManager:
     """
@@ -30,8 +39,11 @@ class RSSManager:
         self.logger = logging.getLogger(__name__)
         self.last_request_times = {}
         
-        # Discord webhook for notifications
+        # Discord webhook for notifications, with its own small connection pool
+        # so webhook posts don't take pool slots from feed fetching
         self.discord_webhook = os.getenv("DISCORD_CHANNEL_WEBHOOK")
+        self._discord_session = requests.Session()
+        self._discord_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
         
         # Track sent URLs to prevent duplicates
         self.sent_urls = set()
@@ -104,9 +116,10 @@ class RSSManager:
                 "content": content
             }
             
-            response = requests.post(
+            response = self._discord_session.post(
                 self.discord_webhook,
-                json=payload,
+                data=orjson.dumps(payload),
+                headers={'Content-Type': 'application/json'},
                 timeout=10
             )
             response.raise_for_status()
@@ -122,7 +135,7 @@ class RSSManager:
     def _setup_session(self):
         """Configure the requests session with realistic headers."""
         self.session.headers.update({
-            'User-Agent': 'Mexican Spanish Corpus RSS Reader/1.0 (Academic Research)',
+            'User-Agent': RSS_USER_AGENT,
             'Accept': 'application/rss+xml, application/xml, text/xml, application/atom+xml, */*',
             'Accept-Language': 'es-MX,es;q=0.9,en;q=0.8',
             'Connection': 'keep-alive',
@@ -141,18 +154,18 @@ class RSSManager:
     
     def _enforce_rate_limit(self, domain: str):
         """Enforce politeness delay between requests to the same domain."""
-        current_time = time.time()
+        current_time = time.monotonic_ns()
         
         if domain in self.last_request_times:
             time_since_last = current_time - self.last_request_times[domain]
-            base_delay = self.politeness_config.get('request_delay', 2.0)
+            base_delay = int(self.politeness_config.get('request_delay', 2.0) * 1e9)
             
             if time_since_last < base_delay:
-                sleep_time = base_delay - time_since_last
+                sleep_time = (base_delay - time_since_last) / 1e9
                 self.logger.debug(f"RSS rate limiting: sleeping {sleep_time:.2f}s for {domain}")
                 time.sleep(sleep_time)
         
-        self.last_request_times[domain] = time.time()
+        self.last_request_times[domain] = time.monotonic_ns()
     
     def fetch_feed(self, feed_url: str, source_name: str) -> List[Dict[str, Any]]:
         """
@@ -171,10 +184,7 @@ class RSSManager:
             
             self.logger.info(f"Fetching RSS feed: {source_name} ({feed_url})")
             
-            # Configure feedparser with session settings
-            feedparser.USER_AGENT = self.session.headers.get('User-Agent', 'feedparser')
-            
-            # Try to fetch manually first to handle SSL issues
+            # Fetch through our session to reuse pooled connections and SSL settings
             try:
                 response = self.session.get(feed_url, verify=self.session.verify)
                 response.raise_for_status()
@@ -189,16 +199,21 @@ class RSSManager:
                     content_str = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', content_str)
                     content = content_str.encode('utf-8')
                 
-                feed = feedparser.parse(content)
-            except Exception as manual_error:
-                self.logger.warning(f"Manual fetch failed for {source_name}: {manual_error}")
-                # Fall back to feedparser's internal fetching
+                # Fast path: standard RSS 2.0 / Atom feeds parsed with lxml
                 try:
-                    # Configure feedparser to use custom agent settings
-                    feed = feedparser.parse(feed_url, agent=self.session.headers.get('User-Agent'))
-                except Exception as fallback_error:
-                    self.logger.error(f"Both manual and feedparser methods failed for {source_name}: {fallback_error}")
-                    return []
+                    entries = self._lxml_parse(content, source_name, feed_url)
+                except etree.XMLSyntaxError as parse_error:
+                    self.logger.debug(f"lxml could not parse {source_name}, using feedparser: {parse_error}")
+                    entries = None
+                
+                if entries:
+                    self.logger.info(f"Successfully parsed {len(entries)} entries from {source_name}")
+                    return entries
+                
+                feed = feedparser.parse(content)
+            except Exception as fetch_error:
+                self.logger.error(f"Failed to fetch or parse feed {source_name}: {fetch_error}")
+                return []
             
             if feed.bozo:
                 self.logger.warning(f"Feed parsing issues for {source_name}: {feed.bozo_exception}")
@@ -226,6 +241,103 @@ class RSSManager:
             self.logger.error(f"Failed to fetch RSS feed {source_name}: {e}")
             return []
     
+    def _lxml_parse(self, content: bytes, source_name: str, feed_url: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse a standard RSS 2.0 or Atom feed with lxml.
+        
+        Returns entries in the same shape as _process_feed_entry, or None when
+        the document has no RSS items or Atom entries (e.g. RSS 1.0/RDF), so the
+        caller can fall back to feedparser.
+        
+        Raises:
+            etree.XMLSyntaxError: If the content cannot be parsed as XML
+        """
+        parser = etree.XMLParser(recover=True, huge_tree=False)
+        root = etree.fromstring(content, parser=parser)
+        if root is None:
+            return None
+        
+        items = root.findall('.//item')
+        is_atom = not items
+        if is_atom:
+            items = root.findall(f'.//{ATOM_NS}entry')
+        if not items:
+            return None
+        
+        entries = []
+        for item in items:
+            if is_atom:
+                link = ''
+                for link_elem in item.findall(f'{ATOM_NS}link'):
+                    if link_elem.get('rel', 'alternate') == 'alternate':
+                        link = link_elem.get('href', '')
+                        break
+                title = self._atom_text(item.find(f'{ATOM_NS}title'))
+                description = (self._atom_text(item.find(f'{ATOM_NS}summary'))
+                               or self._atom_text(item.find(f'{ATOM_NS}content')))
+                date_text = item.findtext(f'{ATOM_NS}published') or item.findtext(f'{ATOM_NS}updated')
+                categories = [c.get('term') for c in item.findall(f'{ATOM_NS}category') if c.get('term')]
+                entry_id = item.findtext(f'{ATOM_NS}id')
+            else:
+                link = item.findtext('link')
+                title = item.findtext('title')
+                description = item.findtext('description')
+                date_text = item.findtext('pubDate')
+                categories = [c.text.strip() for c in item.findall('category') if c.text]
+                entry_id = item.findtext('guid')
+            
+            link = (link or '').strip()
+            # Skip entries without links
+            if not link:
+                continue
+            
+            entries.append({
+                'url': link,
+                'title': (title or '').strip() or 'Sin título',
+                'description': (description or '').strip(),
+                'published_date': self._parse_feed_date(date_text, is_atom),
+                'categories': categories,
+                'source': source_name,
+                'feed_url': feed_url,
+                'entry_id': (entry_id or '').strip() or link,
+                'discovered_at': datetime.now()
+            })
+        
+        return entries
+    
+    @staticmethod
+    def _atom_text(elem) -> Optional[str]:
+        """
+        Text of an Atom text construct.
+        
+        type="xhtml" content is wrapped in child elements, which findtext()
+        would drop, so gather the text of the whole subtree instead.
+        """
+        if elem is None:
+            return None
+        if len(elem):
+            return ''.join(elem.itertext())
+        return elem.text
+    
+    def _parse_feed_date(self, date_text: Optional[str], is_atom: bool) -> Optional[datetime]:
+        """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date into a naive UTC datetime."""
+        if not date_text:
+            return None
+        
+        try:
+            date_text = date_text.strip()
+            if is_atom:
+                pub_date = datetime.fromisoformat(date_text.replace('Z', '+00:00'))
+            else:
+                pub_date = parsedate_to_datetime(date_text)
+        except (TypeError, ValueError):
+            return None
+        
+        # Match feedparser's *_parsed tuples, which are naive UTC
+        if pub_date.tzinfo is not None:
+            pub_date = pub_date.astimezone(timezone.utc).replace(tzinfo=None)
+        return pub_date
+    
     def _process_feed_entry(self, entry: Any, source_name: str, feed_url: str) -> Optional[Dict[str, Any]]:
         """Process a single RSS feed entry."""
         try:
@@ -368,4 +480,5 @@ class RSSManager:
     
     def close(self):
         """Clean up resources."""
-        self.session.close()
\ No newline at end of file
+        self.session.close()
+        self._discord_session.close()
\ No newline at end of file
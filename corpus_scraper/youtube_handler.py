@@ -5,20 +5,40 @@ Extracts transcripts from Mexican YouTubers and Spanish-language channels.
 
 import logging
 import time
+import threading
+import concurrent.futures
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
 from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound
 from .geographic_filter import GeographicFilter
 import re
 
 
+# Lookup sets for the quick Spanish check on transcripts
+_SPANISH_CHARS = frozenset('ñüáéíóú')
+_SPANISH_WORDS = frozenset({
+    'que', 'pero', 'como', 'para', 'con', 'por', 'este', 'una', 'muy', 'hola', 'gracias'
+})
+_WORD_RE = re.compile(r'[a-záéíóúñü]+')
+
+
 class YouTubeHandler:
     """
     Specialized handler for YouTube transcript extraction.
     Focuses on Mexican YouTubers and Spanish-language content.
     """
     
+    # Compiled once: these run per URL and per transcript segment
+    # /channel/<id>, /c/<name>, /@<handle> and /user/<name> in one pass over the URL
+    _CHANNEL_URL_RE = re.compile(r'youtube\.com/(?:channel/|c/|@|user/)([a-zA-Z0-9_-]+)')
+    _BRACKET_RE = re.compile(r'\[.*?\]')
+    _WHITESPACE_RE = re.compile(r'\s+')
+    
+    # channels.list parts requested together and cached per channel
+    CHANNEL_PARTS = 'id,snippet,contentDetails'
+    
     def __init__(self, youtube_config: Dict):
         self.config = youtube_config
         self.logger = logging.getLogger(__name__)
@@ -37,9 +57,28 @@ class YouTubeHandler:
         # Content quality thresholds
         self.min_transcript_length = 100  # Minimum transcript length
         self.max_videos_per_channel = self.config.get('max_videos_per_channel', 500)
+        # Channels processed in parallel; each worker still paces its own API calls
+        self.max_concurrent_channels = self.config.get('max_concurrent_channels', 4)
+        # Transcript downloads in flight per channel
+        self.max_transcript_workers = self.config.get('max_transcript_workers', 8)
+        # Transcript downloads in flight across all channels combined
+        self.max_total_transcript_requests = self.config.get(
+            'max_total_transcript_requests', self.max_transcript_workers
+        )
+        self._transcript_slots = threading.BoundedSemaphore(
+            max(1, self.max_total_transcript_requests)
+        )
         
         # API base URL
         self.api_base = "https://www.googleapis.com/youtube/v3"
+        
+        # channels.list items by channel ID, fetched once with every part we use
+        self._channel_meta_cache: Dict[str, Dict] = {}
+        
+        # Keep-alive session so paginated API calls reuse one TLS connection
+        self.api_session = requests.Session()
+        self.api_session.mount('https://www.googleapis.com',
+                               HTTPAdapter(pool_connections=4, pool_maxsize=16))
     
     def discover_content(self, channel_urls: List[str] = None) -> Dict[str, List[Dict]]:
         """
@@ -69,22 +108,28 @@ class YouTubeHandler:
         else:
             channels_to_process = self.mexican_channels
         
-        for channel_name, channel_id in channels_to_process.items():
-            try:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, self.max_concurrent_channels),
+            thread_name_prefix="youtube-channel"
+        ) as executor:
+            future_to_channel = {}
+            for channel_name, channel_id in channels_to_process.items():
                 self.logger.info(f"Processing YouTube channel: {channel_name}")
-                
-                channel_content = self._process_channel(channel_id, channel_name)
-                
-                if channel_content:
-                    all_content[f"youtube_{channel_name}"] = channel_content
-                    self.logger.info(f"Collected {len(channel_content)} transcripts from {channel_name}")
-                
-                # Rate limiting
-                time.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(f"Failed to process channel {channel_name}: {e}")
-                continue
+                future = executor.submit(self._process_channel, channel_id, channel_name)
+                future_to_channel[future] = channel_name
+            
+            for future in concurrent.futures.as_completed(future_to_channel):
+                channel_name = future_to_channel[future]
+                try:
+                    channel_content = future.result()
+                    
+                    if channel_content:
+                        all_content[f"youtube_{channel_name}"] = channel_content
+                        self.logger.info(f"Collected {len(channel_content)} transcripts from {channel_name}")
+                    
+                except Exception as e:
+                    self.logger.error(f"Failed to process channel {channel_name}: {e}")
+                    continue
         
         total_items = sum(len(items) for items in all_content.values())
         self.logger.info(f"YouTube discovery complete: {total_items} total transcripts")
@@ -93,23 +138,15 @@ class YouTubeHandler:
     
     def _extract_channel_id(self, url: str) -> Optional[str]:
         """Extract channel ID from YouTube URL."""
-        patterns = [
-            r'youtube\.com\/channel\/([a-zA-Z0-9_-]+)',
-            r'youtube\.com\/c\/([a-zA-Z0-9_-]+)',
-            r'youtube\.com\/@([a-zA-Z0-9_-]+)',
-            r'youtube\.com\/user\/([a-zA-Z0-9_-]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                username_or_id = match.group(1)
-                
-                # If it's a username/handle, resolve to channel ID
-                if not username_or_id.startswith('UC'):
-                    return self._resolve_channel_id(username_or_id)
-                else:
-                    return username_or_id
+        match = self._CHANNEL_URL_RE.search(url)
+        if match:
+            username_or_id = match.group(1)
+            
+            # If it's a username/handle, resolve to channel ID
+            if not username_or_id.startswith('UC'):
+                return self._resolve_channel_id(username_or_id)
+            else:
+                return username_or_id
         
         return None
     
@@ -120,15 +157,17 @@ class YouTubeHandler:
             params = {
                 'key': self.api_key,
                 'forUsername': username,
-                'part': 'id'
+                'part': self.CHANNEL_PARTS
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.api_session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
             if data.get('items'):
-                return data['items'][0]['id']
+                item = data['items'][0]
+                self._channel_meta_cache[item['id']] = item
+                return item['id']
             
             return None
             
@@ -136,22 +175,37 @@ class YouTubeHandler:
             self.logger.error(f"Error resolving channel ID for {username}: {e}")
             return None
     
+    def _get_channel_meta(self, channel_id: str) -> Optional[Dict]:
+        """
+        Get a channel's channels.list item, requesting it at most once.
+        
+        The item carries the id, snippet and contentDetails parts so name and
+        uploads-playlist lookups share a single API call and quota unit.
+        """
+        if channel_id in self._channel_meta_cache:
+            return self._channel_meta_cache[channel_id]
+        
+        url = f"{self.api_base}/channels"
+        params = {
+            'key': self.api_key,
+            'id': channel_id,
+            'part': self.CHANNEL_PARTS
+        }
+        
+        response = self.api_session.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        
+        data = response.json()
+        item = data['items'][0] if data.get('items') else None
+        self._channel_meta_cache[channel_id] = item
+        return item
+    
     def _get_channel_name(self, channel_id: str) -> str:
         """Get channel name from channel ID."""
         try:
-            url = f"{self.api_base}/channels"
-            params = {
-                'key': self.api_key,
-                'id': channel_id,
-                'part': 'snippet'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            if data.get('items'):
-                return data['items'][0]['snippet']['title']
+            meta = self._get_channel_meta(channel_id)
+            if meta:
+                return meta['snippet']['title']
             
             return channel_id
             
@@ -163,20 +217,28 @@ class YouTubeHandler:
         """Process a single YouTube channel."""
         try:
             videos = self._get_channel_videos(channel_id)
-            transcripts = []
             
-            for video in videos[:self.max_videos_per_channel]:
-                try:
-                    transcript_data = self._extract_video_transcript(video, channel_name)
-                    if transcript_data:
-                        transcripts.append(transcript_data)
-                    
-                    # Rate limiting
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    self.logger.debug(f"Error processing video {video['id']}: {e}")
-                    continue
+            def process_video(video: Dict) -> Optional[Dict]:
+                # Slots are shared by every channel worker, so concurrent
+                # channels cannot multiply the requests sent to YouTube
+                with self._transcript_slots:
+                    try:
+                        return self._extract_video_transcript(video, channel_name)
+                    except Exception as e:
+                        self.logger.debug(f"Error processing video {video['id']}: {e}")
+                        return None
+                    finally:
+                        # Rate limiting, held while the slot is taken
+                        time.sleep(0.5)
+            
+            # Transcript fetches are blocking HTTPS calls, so overlap them;
+            # map keeps results in playlist order
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, self.max_transcript_workers),
+                thread_name_prefix="youtube-transcript"
+            ) as executor:
+                results = executor.map(process_video, videos[:self.max_videos_per_channel])
+                transcripts = [transcript for transcript in results if transcript]
             
             return transcripts
             
@@ -188,21 +250,11 @@ class YouTubeHandler:
         """Get list of videos from a YouTube channel."""
         try:
             # First get the uploads playlist ID
-            url = f"{self.api_base}/channels"
-            params = {
-                'key': self.api_key,
-                'id': channel_id,
-                'part': 'contentDetails'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            if not data.get('items'):
+            meta = self._get_channel_meta(channel_id)
+            if not meta:
                 return []
             
-            uploads_playlist_id = data['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+            uploads_playlist_id = meta['contentDetails']['relatedPlaylists']['uploads']
             
             # Get videos from uploads playlist
             videos = []
@@ -221,7 +273,7 @@ class YouTubeHandler:
                 if next_page_token:
                     params['pageToken'] = next_page_token
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = self.api_session.get(url, params=params, timeout=10)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -262,17 +314,12 @@ class YouTubeHandler:
                 try:
                     transcript_list = YouTubeTranscriptApi.get_transcript(video_id, languages=[lang])
                     
-                    # Combine transcript segments
-                    transcript_segments = []
-                    for segment in transcript_list:
-                        text = segment['text'].strip()
-                        # Clean up auto-generated transcript artifacts
-                        text = re.sub(r'\[.*?\]', '', text)  # Remove [Music], [Applause], etc.
-                        text = re.sub(r'\s+', ' ', text)     # Normalize whitespace
-                        if text:
-                            transcript_segments.append(text)
-                    
-                    transcript_text = ' '.join(transcript_segments)
+                    # Combine transcript segments, then clean the whole text in one pass.
+                    # Newline-joined so a stray '[' can't match past its own segment
+                    transcript_text = '\n'.join(segment['text'] for segment in transcript_list)
+                    # Clean up auto-generated transcript artifacts
+                    transcript_text = self._BRACKET_RE.sub('', transcript_text)  # Remove [Music], [Applause], etc.
+                    transcript_text = self._WHITESPACE_RE.sub(' ', transcript_text).strip()  # Normalize whitespace
                     break
                     
                 except NoTranscriptFound:
@@ -314,21 +361,25 @@ class YouTubeHandler:
     
     def _has_spanish_indicators(self, text: str) -> bool:
         """Quick check for Spanish language indicators."""
-        spanish_chars = ['ñ', 'ü', 'á', 'é', 'í', 'ó', 'ú']
-        spanish_words = ['que', 'pero', 'como', 'para', 'con', 'por', 'este', 'una', 'muy', 'hola', 'gracias']
-        
         text_lower = text.lower()
         
         # Check for Spanish characters
-        if any(char in text_lower for char in spanish_chars):
+        if not _SPANISH_CHARS.isdisjoint(text_lower):
             return True
         
         # Check for common Spanish words
-        words = text_lower.split()
-        spanish_word_count = sum(1 for word in words if word in spanish_words)
+        words = _WORD_RE.findall(text_lower)
         
         # Need higher threshold for transcripts (more words)
-        return spanish_word_count >= len(words) * 0.05  # At least 5% Spanish words
+        threshold = len(words) * 0.05  # At least 5% Spanish words
+        spanish_word_count = 0
+        for word in words:
+            if word in _SPANISH_WORDS:
+                spanish_word_count += 1
+                if spanish_word_count >= threshold:
+                    return True
+        
+        return spanish_word_count >= threshold
     
     def get_trending_mexican_videos(self, region_code: str = 'MX') -> List[Dict]:
         """Get trending videos from Mexico."""
@@ -345,7 +396,7 @@ class YouTubeHandler:
                 'maxResults': 50
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.api_session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -378,4 +429,8 @@ class YouTubeHandler:
             
         except Exception as e:
             self.logger.error(f"Error getting trending Mexican videos: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def close(self):
+        """Close the YouTube API session."""
+        self.api_session.close()
@@ -5,17 +5,25 @@ Runs the complete enhanced framework with aggressive data collection strategies.
 """
 
 import argparse
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
-import json
+from typing import TYPE_CHECKING
+import orjson
 
 # Add corpus_scraper to path
 sys.path.insert(0, str(Path(__file__).parent / 'corpus_scraper'))
 
-from corpus_scraper.high_yield_orchestrator import HighYieldOrchestrator
-from corpus_scraper.config_manager import ConfigManager
+if TYPE_CHECKING:
+    from corpus_scraper.high_yield_orchestrator import HighYieldOrchestrator
+
+
+# orjson writes UTF-8 as-is (like ensure_ascii=False) and serializes datetimes natively
+SAVE_RESULTS_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
 
 def setup_enhanced_logging(log_level: str = "INFO", log_file: str = None):
@@ -31,11 +39,19 @@ def setup_enhanced_logging(log_level: str = "INFO", log_file: str = None):
         ]
     )
     
-    # Add file handler if specified
+    # Add file handler if specified. Records are handed to a queue and written
+    # by a listener thread, so scraper threads never wait on disk I/O
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setFormatter(logging.Formatter(log_format))
-        logging.getLogger().addHandler(file_handler)
+        
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        # Flush whatever is still queued when the process exits
+        atexit.register(listener.stop)
+        
+        logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Reduce noise from third-party libraries
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -119,7 +135,7 @@ def print_harvest_summary(results: dict):
     print("="*80)
 
 
-def run_discovery_only(orchestrator: HighYieldOrchestrator):
+def run_discovery_only(orchestrator: 'HighYieldOrchestrator'):
     """Run URL discovery only without processing."""
     print("🔍 Running discovery-only mode...")
     
@@ -136,7 +152,7 @@ def run_discovery_only(orchestrator: HighYieldOrchestrator):
     return discovered_urls
 
 
-def run_status_check(orchestrator: HighYieldOrchestrator):
+def run_status_check(orchestrator: 'HighYieldOrchestrator'):
     """Check current harvest status."""
     print("📊 Checking harvest status...")
     
@@ -265,6 +281,9 @@ Examples:
         print()
     
     try:
+        # Imported here so --help and argument errors don't load the whole framework
+        from corpus_scraper.high_yield_orchestrator import HighYieldOrchestrator
+        
         # Initialize enhanced orchestrator
         logger.info("Initializing high-yield orchestrator...")
         orchestrator = HighYieldOrchestrator(args.config, args.sources)
@@ -279,12 +298,12 @@ Examples:
             discovered_urls = run_discovery_only(orchestrator)
             
             if args.save_results:
-                with open(args.save_results, 'w', encoding='utf-8') as f:
-                    json.dump({
+                with open(args.save_results, 'wb') as f:
+                    f.write(orjson.dumps({
                         'discovery_results': {k: v[:100] for k, v in discovered_urls.items()},  # Limit for JSON size
                         'total_urls': sum(len(urls) for urls in discovered_urls.values()),
                         'timestamp': datetime.now().isoformat()
-                    }, f, indent=2, ensure_ascii=False)
+                    }, option=SAVE_RESULTS_OPTIONS))
                 print(f"📁 Results saved to: {args.save_results}")
             
             return 0
@@ -302,8 +321,8 @@ Examples:
             
             # Save results if requested
             if args.save_results:
-                with open(args.save_results, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+                with open(args.save_results, 'wb') as f:
+                    f.write(orjson.dumps(results, option=SAVE_RESULTS_OPTIONS, default=str))
                 print(f"📁 Detailed results saved to: {args.save_results}")
             
             return 0 if results.get('success', False) else 1